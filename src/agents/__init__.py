@@ -1,6 +1,6 @@
 """Pydantic-AI agent definitions for clinical research workflows."""
 
-from .base import AgentDeps
+from .base import AgentDeps, get_default_model
 from .orchestrator import orchestrator_agent
 from .project_manager import project_manager_agent, ProjectEstimate, CostEstimate
 from .document_maker import document_maker_agent, ComplianceDocument, DocumentSection
@@ -8,6 +8,7 @@ from .email_drafter import email_drafter_agent, DraftEmail
 
 __all__ = [
     "AgentDeps",
+    "get_default_model",
     "orchestrator_agent",
     "project_manager_agent",
     "ProjectEstimate",
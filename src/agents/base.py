@@ -1,17 +1,70 @@
 """Shared agent dependencies and types."""
 
-from dataclasses import dataclass
-from typing import Awaitable, Callable, Any
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, Any, Iterator
 
+from pydantic_ai.models import Model, infer_model
+from sqlalchemy import Connection
 from sqlalchemy.orm import Session
 
+from src.services.prompt_store import get_prompt_store
+from src.utils.config import get_config
 
-@dataclass
+
+@lru_cache(maxsize=1)
+def get_default_model() -> Model:
+    """Return the configured default model, constructed once per process.
+
+    Passing a model name to ``Agent.run`` builds a new model and provider on
+    every call; reusing one instance keeps a single provider and HTTP client
+    (with its keep-alive connections) across all agent runs.
+    """
+    return infer_model(get_config().default_model)
+
+
+# Composed instructions per agent key, with the prompt store version they were built from
+_instructions_cache: dict[str, tuple[int, str]] = {}
+
+
+def build_instructions(agent_key: str, base_instructions: str) -> str:
+    """Return an agent's instructions with any user customizations appended.
+
+    The composed string is cached per agent and only rebuilt when the
+    prompt store file changes, so the common case is a single stat call.
+
+    Args:
+        agent_key: Prompt store key of the agent (e.g. ``"orchestrator"``).
+        base_instructions: The agent's built-in instructions.
+
+    Returns:
+        The full instructions string.
+    """
+    store = get_prompt_store()
+    version = store.version
+    cached = _instructions_cache.get(agent_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    custom = store.get(agent_key)
+    if custom:
+        instructions = base_instructions + f"\n\n## Additional User Instructions\n{custom}"
+    else:
+        instructions = base_instructions
+    _instructions_cache[agent_key] = (version, instructions)
+    return instructions
+
+
+@dataclass(slots=True)
 class AgentDeps:
     """Shared dependencies injected into all agents.
 
     Attributes:
-        db_session: SQLAlchemy database session for persistence.
+        db_session: SQLAlchemy database session for persistence. Expected to
+            come from ``get_session()``, which disables ``expire_on_commit``
+            so attributes stay loaded across the commits made during a run.
         workspace_path: Path to the project workspace directory.
         project_id: ID of the current project.
         mcp_filesystem: MCP server for filesystem operations.
@@ -19,6 +72,11 @@ class AgentDeps:
         mcp_email: MCP server for email operations (optional).
         approval_callback: Async function to request human approval.
         progress_callback: Function to send progress updates to UI.
+        question_callback: Async function to ask the researcher a question.
+        step_status_callback: Optional function reporting a plan step's
+            status (running, completed, failed) by its plan index.
+        workspace_dir: ``workspace_path`` as a Path, resolved once.
+        drafts_dir: The workspace's ``drafts/`` subdirectory.
     """
 
     db_session: Session
@@ -30,14 +88,34 @@ class AgentDeps:
     approval_callback: Callable[[str, dict], Awaitable[bool]]
     progress_callback: Callable[[str, str], None]
     question_callback: Callable[[str, list[str]], Awaitable[str]]
+    step_status_callback: Callable[[int, str], None] | None = None
+    workspace_dir: Path = field(init=False, repr=False, compare=False)
+    drafts_dir: Path = field(init=False, repr=False, compare=False)
+    _active_servers: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Resolve workspace paths and active MCP servers once per run."""
+        self.workspace_dir = Path(self.workspace_path)
+        self.drafts_dir = self.workspace_dir / "drafts"
+        self._active_servers = tuple(
+            server
+            for server in (self.mcp_filesystem, self.mcp_web_search, self.mcp_email)
+            if server is not None
+        )
+
+    def get_active_mcp_servers(self) -> tuple:
+        """Get the active MCP servers."""
+        return self._active_servers
+
+    @contextmanager
+    def read_only(self) -> Iterator[Connection]:
+        """Open a Core connection for read-only queries.
+
+        Tools that only SELECT can use this instead of ``db_session`` to skip
+        the ORM identity map and autoflush.
 
-    def get_active_mcp_servers(self) -> list:
-        """Get list of active MCP servers."""
-        servers = []
-        if self.mcp_filesystem is not None:
-            servers.append(self.mcp_filesystem)
-        if self.mcp_web_search is not None:
-            servers.append(self.mcp_web_search)
-        if self.mcp_email is not None:
-            servers.append(self.mcp_email)
-        return servers
+        Yields:
+            A connection bound to the session's engine.
+        """
+        with self.db_session.get_bind().connect() as conn:
+            yield conn
@@ -1,9 +1,13 @@
 """Document Maker agent for compliance document drafting."""
 
+import asyncio
+import time
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 
-from .base import AgentDeps
+from .base import AgentDeps, build_instructions
 
 
 class DocumentSection(BaseModel):
@@ -61,14 +65,98 @@ File organization:
 - Include document metadata at the top
 """
 
+# Metadata header prepended to saved documents
+DOCUMENT_HEADER_TEMPLATE = """---
+document_type: {document_type}
+created: {created}
+version: 1.0
+status: draft
+---
+
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RequiredDocument:
+    """A regulatory document a study must prepare."""
+
+    type: str
+    required: bool
+    reference: str
+    description: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ICFSection:
+    """A section an Informed Consent Form must contain."""
+
+    section: str
+    required: bool = True
+
+
+# Documents required for all interventional studies
+BASE_REQUIRED_DOCUMENTS = (
+    RequiredDocument(
+        type="Protocol",
+        required=True,
+        reference="ICH E6(R2) Section 6",
+        description="Study protocol with objectives, design, methodology",
+    ),
+    RequiredDocument(
+        type="Informed Consent Form",
+        required=True,
+        reference="21 CFR 50, ICH E6(R2) 4.8",
+        description="Patient consent document",
+    ),
+    RequiredDocument(
+        type="Investigator's Brochure",
+        required=True,
+        reference="ICH E7",
+        description="Compilation of clinical and nonclinical data",
+    ),
+    RequiredDocument(
+        type="IRB Application",
+        required=True,
+        reference="21 CFR 56",
+        description="Institutional Review Board submission",
+    ),
+)
+
+# Phase-specific additions
+PHASE_REQUIRED_DOCUMENTS = {
+    "1": (
+        RequiredDocument(type="First-in-Human Protocol Addendum", required=True, reference="ICH M3(R2)"),
+    ),
+    "3": (
+        RequiredDocument(type="Statistical Analysis Plan", required=True, reference="ICH E9"),
+        RequiredDocument(type="Data Management Plan", required=True, reference="ICH E6(R2) 5.5"),
+    ),
+}
+
+# Full document list per phase with additions, built once
+_DOCUMENTS_BY_PHASE = {
+    phase: BASE_REQUIRED_DOCUMENTS + documents
+    for phase, documents in PHASE_REQUIRED_DOCUMENTS.items()
+}
+
+# Required Informed Consent Form sections per 21 CFR 50
+ICF_REQUIRED_SECTIONS = tuple(ICFSection(name) for name in (
+    "Study Title and Purpose",
+    "Study Procedures",
+    "Risks and Discomforts",
+    "Benefits",
+    "Alternatives to Participation",
+    "Confidentiality",
+    "Costs and Compensation",
+    "Voluntary Participation",
+    "Contact Information",
+    "Signature Lines",
+))
+
+
 def _get_document_maker_instructions(ctx: RunContext[AgentDeps]) -> str:
     """Return document maker instructions, appending any user customizations."""
-    from src.services.prompt_store import PromptStore
-
-    custom = PromptStore().get("document_maker")
-    if custom:
-        return DOCUMENT_MAKER_INSTRUCTIONS + f"\n\n## Additional User Instructions\n{custom}"
-    return DOCUMENT_MAKER_INSTRUCTIONS
+    return build_instructions("document_maker", DOCUMENT_MAKER_INSTRUCTIONS)
 
 
 document_maker_agent = Agent(
@@ -95,27 +183,21 @@ async def save_document(
     Returns:
         Path to the saved document.
     """
-    from pathlib import Path
-    from datetime import datetime
-
     # Ensure .md extension for draft documents
     if not filename.endswith((".md", ".txt", ".docx")):
         filename = f"{filename}.md"
 
-    filepath = Path(ctx.deps.workspace_path) / filename
+    filepath = ctx.deps.workspace_dir / filename
 
     # Add metadata header
-    header = f"""---
-document_type: {document_type}
-created: {datetime.now().isoformat()}
-version: 1.0
-status: draft
----
-
-"""
+    header = DOCUMENT_HEADER_TEMPLATE.format(
+        document_type=document_type,
+        created=time.strftime("%Y-%m-%dT%H:%M:%S"),
+    )
     full_content = header + content
 
-    filepath.write_text(full_content, encoding="utf-8")
+    # Off the event loop, so concurrent delegations keep running
+    await asyncio.to_thread(filepath.write_text, full_content, encoding="utf-8")
 
     ctx.deps.progress_callback("Document Saved", f"{document_type} saved to {filename}")
     return str(filepath)
@@ -126,7 +208,7 @@ async def list_required_documents(
     ctx: RunContext[AgentDeps],
     study_phase: str,
     therapeutic_area: str,
-) -> list[dict]:
+) -> tuple[RequiredDocument, ...]:
     """List required regulatory documents for a study.
 
     Args:
@@ -134,70 +216,16 @@ async def list_required_documents(
         therapeutic_area: Therapeutic area of the study.
 
     Returns:
-        List of required documents with descriptions and regulatory references.
+        The required documents with descriptions and regulatory references.
     """
-    # Base documents required for all interventional studies
-    base_docs = [
-        {
-            "type": "Protocol",
-            "required": True,
-            "reference": "ICH E6(R2) Section 6",
-            "description": "Study protocol with objectives, design, methodology",
-        },
-        {
-            "type": "Informed Consent Form",
-            "required": True,
-            "reference": "21 CFR 50, ICH E6(R2) 4.8",
-            "description": "Patient consent document",
-        },
-        {
-            "type": "Investigator's Brochure",
-            "required": True,
-            "reference": "ICH E7",
-            "description": "Compilation of clinical and nonclinical data",
-        },
-        {
-            "type": "IRB Application",
-            "required": True,
-            "reference": "21 CFR 56",
-            "description": "Institutional Review Board submission",
-        },
-    ]
-
-    # Phase-specific additions
-    phase_docs = {
-        "1": [
-            {"type": "First-in-Human Protocol Addendum", "required": True, "reference": "ICH M3(R2)"},
-        ],
-        "3": [
-            {"type": "Statistical Analysis Plan", "required": True, "reference": "ICH E9"},
-            {"type": "Data Management Plan", "required": True, "reference": "ICH E6(R2) 5.5"},
-        ],
-    }
-
-    docs = base_docs.copy()
-    if study_phase in phase_docs:
-        docs.extend(phase_docs[study_phase])
-
-    return docs
+    return _DOCUMENTS_BY_PHASE.get(study_phase, BASE_REQUIRED_DOCUMENTS)
 
 
 @document_maker_agent.tool
-async def get_icf_template_sections(ctx: RunContext[AgentDeps]) -> list[dict]:
+async def get_icf_template_sections(ctx: RunContext[AgentDeps]) -> tuple[ICFSection, ...]:
     """Get the required sections for an Informed Consent Form per 21 CFR 50.
 
     Returns:
-        List of required ICF sections with descriptions.
+        The required ICF sections.
     """
-    return [
-        {"section": "Study Title and Purpose", "required": True},
-        {"section": "Study Procedures", "required": True},
-        {"section": "Risks and Discomforts", "required": True},
-        {"section": "Benefits", "required": True},
-        {"section": "Alternatives to Participation", "required": True},
-        {"section": "Confidentiality", "required": True},
-        {"section": "Costs and Compensation", "required": True},
-        {"section": "Voluntary Participation", "required": True},
-        {"section": "Contact Information", "required": True},
-        {"section": "Signature Lines", "required": True},
-    ]
+    return ICF_REQUIRED_SECTIONS
@@ -1,9 +1,14 @@
 """Email Drafter agent for professional correspondence."""
 
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 
-from .base import AgentDeps
+from .base import AgentDeps, build_instructions
 
 
 class DraftEmail(BaseModel):
@@ -54,14 +59,79 @@ Format guidelines:
 - Appropriate urgency indicators when needed
 """
 
+
+@dataclass(frozen=True, slots=True)
+class EmailTemplate:
+    """Structure of a common email type."""
+
+    subject_pattern: str
+    required_elements: tuple[str, ...]
+    attachments_typical: tuple[str, ...] = ()
+
+
+# Template structures for common email types
+EMAIL_TEMPLATES = {
+    "irb_submission": EmailTemplate(
+        subject_pattern="[Protocol #] - [Submission Type] - [Study Short Title]",
+        required_elements=(
+            "Protocol number and title",
+            "Type of submission (initial, amendment, continuing review)",
+            "Brief summary of submission",
+            "List of documents included",
+            "Request for review timeline if urgent",
+        ),
+        attachments_typical=(
+            "Protocol",
+            "Informed Consent Form",
+            "Investigator's Brochure",
+            "IRB Application Form",
+        ),
+    ),
+    "safety_report": EmailTemplate(
+        subject_pattern="[URGENT] Safety Report - [Event Type] - Protocol [#]",
+        required_elements=(
+            "Event description",
+            "Patient identifier (coded)",
+            "Date of event",
+            "Causality assessment",
+            "Actions taken",
+            "Regulatory reporting status",
+        ),
+        attachments_typical=("Safety Report Form", "MedWatch (if applicable)"),
+    ),
+    "team_update": EmailTemplate(
+        subject_pattern="[Study Short Title] - [Update Type] - [Date]",
+        required_elements=(
+            "Current enrollment status",
+            "Key milestones achieved",
+            "Upcoming activities",
+            "Action items with owners",
+            "Issues requiring attention",
+        ),
+        attachments_typical=("Enrollment tracker", "Timeline update"),
+    ),
+    "recruitment": EmailTemplate(
+        subject_pattern="Research Study Opportunity - [Condition/Topic]",
+        required_elements=(
+            "Study purpose (lay language)",
+            "Who may qualify",
+            "What participation involves",
+            "Contact information",
+            "IRB approval statement",
+        ),
+        attachments_typical=("Study flyer", "Prescreening questionnaire"),
+    ),
+}
+
+DEFAULT_EMAIL_TEMPLATE = EmailTemplate(
+    subject_pattern="[Study] - [Purpose]",
+    required_elements=("Clear purpose", "Relevant details", "Action items"),
+)
+
+
 def _get_email_drafter_instructions(ctx: RunContext[AgentDeps]) -> str:
     """Return email drafter instructions, appending any user customizations."""
-    from src.services.prompt_store import PromptStore
-
-    custom = PromptStore().get("email_drafter")
-    if custom:
-        return EMAIL_DRAFTER_INSTRUCTIONS + f"\n\n## Additional User Instructions\n{custom}"
-    return EMAIL_DRAFTER_INSTRUCTIONS
+    return build_instructions("email_drafter", EMAIL_DRAFTER_INSTRUCTIONS)
 
 
 email_drafter_agent = Agent(
@@ -71,6 +141,12 @@ email_drafter_agent = Agent(
 )
 
 
+def _write_draft(filepath: Path, content: str) -> None:
+    """Write a draft file, creating its parent directory if needed."""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    filepath.write_text(content, encoding="utf-8")
+
+
 @email_drafter_agent.tool
 async def save_email_draft(
     ctx: RunContext[AgentDeps],
@@ -86,32 +162,32 @@ async def save_email_draft(
     Returns:
         Path to the saved draft.
     """
-    from pathlib import Path
-    from datetime import datetime
-
     if not filename.endswith(".txt"):
         filename = f"{filename}.txt"
 
-    filepath = Path(ctx.deps.workspace_path) / "drafts" / filename
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    content = f"""Email Draft
-Created: {datetime.now().isoformat()}
-Status: Pending Review
-
-To: {', '.join(email.get('to', []))}
-CC: {', '.join(email.get('cc', [])) if email.get('cc') else 'None'}
-Subject: {email.get('subject', '')}
-
----
-
-{email.get('body', '')}
-
----
-Attachments Required: {', '.join(email.get('requires_attachments', [])) if email.get('requires_attachments') else 'None'}
-"""
-
-    filepath.write_text(content, encoding="utf-8")
+    filepath = ctx.deps.drafts_dir / filename
+
+    cc = email.get("cc")
+    attachments = email.get("requires_attachments")
+    content = "\n".join((
+        "Email Draft",
+        f"Created: {time.strftime('%Y-%m-%dT%H:%M:%S')}",
+        "Status: Pending Review",
+        "",
+        f"To: {', '.join(email.get('to') or ())}",
+        f"CC: {', '.join(cc) if cc else 'None'}",
+        f"Subject: {email.get('subject', '')}",
+        "",
+        "---",
+        "",
+        email.get("body", ""),
+        "",
+        "---",
+        f"Attachments Required: {', '.join(attachments) if attachments else 'None'}",
+        "",
+    ))
+
+    await asyncio.to_thread(_write_draft, filepath, content)
 
     ctx.deps.progress_callback("Draft Saved", f"Email draft saved to {filepath.name}")
     return str(filepath)
@@ -121,73 +197,13 @@ Attachments Required: {', '.join(email.get('requires_attachments', [])) if email
 async def get_email_template(
     ctx: RunContext[AgentDeps],
     email_type: str,
-) -> dict:
+) -> EmailTemplate:
     """Get a template structure for common email types.
 
     Args:
         email_type: Type of email (irb_submission, safety_report, team_update, etc.)
 
     Returns:
-        Template dictionary with subject pattern and required elements.
+        Template with subject pattern and required elements.
     """
-    templates = {
-        "irb_submission": {
-            "subject_pattern": "[Protocol #] - [Submission Type] - [Study Short Title]",
-            "required_elements": [
-                "Protocol number and title",
-                "Type of submission (initial, amendment, continuing review)",
-                "Brief summary of submission",
-                "List of documents included",
-                "Request for review timeline if urgent",
-            ],
-            "attachments_typical": [
-                "Protocol",
-                "Informed Consent Form",
-                "Investigator's Brochure",
-                "IRB Application Form",
-            ],
-        },
-        "safety_report": {
-            "subject_pattern": "[URGENT] Safety Report - [Event Type] - Protocol [#]",
-            "required_elements": [
-                "Event description",
-                "Patient identifier (coded)",
-                "Date of event",
-                "Causality assessment",
-                "Actions taken",
-                "Regulatory reporting status",
-            ],
-            "attachments_typical": ["Safety Report Form", "MedWatch (if applicable)"],
-        },
-        "team_update": {
-            "subject_pattern": "[Study Short Title] - [Update Type] - [Date]",
-            "required_elements": [
-                "Current enrollment status",
-                "Key milestones achieved",
-                "Upcoming activities",
-                "Action items with owners",
-                "Issues requiring attention",
-            ],
-            "attachments_typical": ["Enrollment tracker", "Timeline update"],
-        },
-        "recruitment": {
-            "subject_pattern": "Research Study Opportunity - [Condition/Topic]",
-            "required_elements": [
-                "Study purpose (lay language)",
-                "Who may qualify",
-                "What participation involves",
-                "Contact information",
-                "IRB approval statement",
-            ],
-            "attachments_typical": ["Study flyer", "Prescreening questionnaire"],
-        },
-    }
-
-    return templates.get(
-        email_type,
-        {
-            "subject_pattern": "[Study] - [Purpose]",
-            "required_elements": ["Clear purpose", "Relevant details", "Action items"],
-            "attachments_typical": [],
-        },
-    )
+    return EMAIL_TEMPLATES.get(email_type, DEFAULT_EMAIL_TEMPLATE)
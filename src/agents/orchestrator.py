@@ -1,10 +1,16 @@
 """Main orchestrator agent for coordinating clinical research workflows."""
 
+import asyncio
+from dataclasses import replace
+
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
+from sqlalchemy.orm import Session
 
-from .base import AgentDeps
-from src.utils.config import get_config
+from .base import AgentDeps, build_instructions, get_default_model
+from .document_maker import document_maker_agent, ComplianceDocument
+from .email_drafter import email_drafter_agent, DraftEmail
+from .project_manager import project_manager_agent, ProjectEstimate
 
 
 class PlanStep(BaseModel):
@@ -45,6 +51,8 @@ Guidelines:
   about when questions are helpful vs. when you can proceed directly.
 - Always break down complex requests into specific, actionable steps
 - Identify which downstream agent should handle each step
+- When executing an approved plan whose steps are independent of each other,
+  use delegate_plan_steps to run them concurrently instead of one at a time
 - Use the filesystem tools to read/write documents in the workspace
 - Request human approval before sending emails or finalizing important documents
 - Provide clear progress updates to keep the researcher informed
@@ -56,12 +64,7 @@ When using MCP tools:
 
 def _get_orchestrator_instructions(ctx: RunContext[AgentDeps]) -> str:
     """Return orchestrator instructions, appending any user customizations."""
-    from src.services.prompt_store import PromptStore
-
-    custom = PromptStore().get("orchestrator")
-    if custom:
-        return ORCHESTRATOR_INSTRUCTIONS + f"\n\n## Additional User Instructions\n{custom}"
-    return ORCHESTRATOR_INSTRUCTIONS
+    return build_instructions("orchestrator", ORCHESTRATOR_INSTRUCTIONS)
 
 
 orchestrator_agent = Agent(
@@ -100,7 +103,7 @@ async def delegate_to_project_manager(
     ctx: RunContext[AgentDeps],
     task: str,
     research_queries: list[str] | None = None,
-) -> str:
+) -> ProjectEstimate:
     """Delegate cost/timeline estimation to the Project Manager agent.
 
     Args:
@@ -108,10 +111,8 @@ async def delegate_to_project_manager(
         research_queries: Optional list of specific items to research costs for.
 
     Returns:
-        The project manager's response with cost and timeline estimates.
+        The project manager's structured cost and timeline estimate.
     """
-    from .project_manager import project_manager_agent
-
     ctx.deps.progress_callback("Delegating", f"Project Manager: {task}")
 
     prompt = task
@@ -119,10 +120,10 @@ async def delegate_to_project_manager(
         prompt += f"\n\nSpecific items to research: {', '.join(research_queries)}"
 
     result = await project_manager_agent.run(
-        prompt, deps=ctx.deps, model=get_config().default_model
+        prompt, deps=ctx.deps, model=get_default_model()
     )
 
-    return str(result.output)
+    return result.output
 
 
 @orchestrator_agent.tool
@@ -130,7 +131,7 @@ async def delegate_to_document_maker(
     ctx: RunContext[AgentDeps],
     document_type: str,
     context: str,
-) -> str:
+) -> ComplianceDocument:
     """Delegate document drafting to the Document Maker agent.
 
     Args:
@@ -138,19 +139,17 @@ async def delegate_to_document_maker(
         context: Background information and requirements for the document.
 
     Returns:
-        The document maker's response with document details and file path.
+        The document maker's structured document, including its file path.
     """
-    from .document_maker import document_maker_agent
-
     ctx.deps.progress_callback("Delegating", f"Document Maker: Creating {document_type}")
 
     prompt = f"Create a {document_type} document.\n\nContext: {context}"
 
     result = await document_maker_agent.run(
-        prompt, deps=ctx.deps, model=get_config().default_model
+        prompt, deps=ctx.deps, model=get_default_model()
     )
 
-    return str(result.output)
+    return result.output
 
 
 @orchestrator_agent.tool
@@ -159,7 +158,7 @@ async def delegate_to_email_drafter(
     email_purpose: str,
     recipients: list[str],
     context: str,
-) -> str:
+) -> DraftEmail:
     """Delegate email drafting to the Email Drafter agent.
 
     Args:
@@ -168,19 +167,17 @@ async def delegate_to_email_drafter(
         context: Background information for the email content.
 
     Returns:
-        The email drafter's response with the draft email.
+        The email drafter's structured draft email.
     """
-    from .email_drafter import email_drafter_agent
-
     ctx.deps.progress_callback("Delegating", f"Email Drafter: {email_purpose}")
 
     prompt = f"Draft an email for {email_purpose}.\n\nRecipients: {', '.join(recipients)}\n\nContext: {context}"
 
     result = await email_drafter_agent.run(
-        prompt, deps=ctx.deps, model=get_config().default_model
+        prompt, deps=ctx.deps, model=get_default_model()
     )
 
-    return str(result.output)
+    return result.output
 
 
 @orchestrator_agent.tool
@@ -215,3 +212,131 @@ async def update_researcher(
         details: Detailed description of current progress.
     """
     ctx.deps.progress_callback(status, details)
+
+
+# Maximum number of sub-agent delegations allowed to run at the same time.
+MAX_INFLIGHT_DELEGATIONS = 4
+
+
+StepResult = ProjectEstimate | ComplianceDocument | DraftEmail | str
+
+
+async def _run_project_manager_step(ctx: RunContext[AgentDeps], step: PlanStep) -> ProjectEstimate:
+    return await delegate_to_project_manager(ctx, step.inputs.get("task", step.description))
+
+
+async def _run_document_maker_step(ctx: RunContext[AgentDeps], step: PlanStep) -> ComplianceDocument:
+    return await delegate_to_document_maker(
+        ctx,
+        step.inputs.get("document_type", step.description),
+        step.inputs.get("context", step.description),
+    )
+
+
+async def _run_email_drafter_step(ctx: RunContext[AgentDeps], step: PlanStep) -> DraftEmail:
+    recipients = [r.strip() for r in step.inputs.get("recipients", "").split(",") if r.strip()]
+    return await delegate_to_email_drafter(
+        ctx,
+        step.inputs.get("email_purpose", step.description),
+        recipients,
+        step.inputs.get("context", step.description),
+    )
+
+
+_STEP_DISPATCH = {
+    "project_manager": _run_project_manager_step,
+    "document_maker": _run_document_maker_step,
+    "email_drafter": _run_email_drafter_step,
+}
+
+
+def _step_context(ctx: RunContext[AgentDeps], session: Session) -> RunContext[AgentDeps]:
+    """Return a copy of *ctx* whose deps use *session* as the database session."""
+    return replace(ctx, deps=replace(ctx.deps, db_session=session))
+
+
+async def run_plan_parallel(
+    ctx: RunContext[AgentDeps],
+    plan: TaskPlan,
+    max_inflight: int = MAX_INFLIGHT_DELEGATIONS,
+) -> list[StepResult]:
+    """Execute the steps of a plan, running independent steps concurrently.
+
+    Steps run in plan order. Consecutive steps that do not require approval
+    are dispatched together, with at most ``max_inflight`` delegations
+    running at once. A step that requires approval waits for the steps
+    before it to finish, then runs on its own once the researcher approves
+    it, so the approved order is kept around every approval point.
+
+    Each step gets its own database session, since concurrent sub-agent runs
+    must not share one. Step status is reported by plan index through
+    ``step_status_callback`` when the deps provide one.
+
+    Args:
+        ctx: Run context of the orchestrator.
+        plan: The plan whose steps should be executed.
+        max_inflight: Maximum number of concurrent sub-agent runs.
+
+    Returns:
+        One result per step, in plan order. Failed or skipped steps are
+        reported as a string.
+    """
+    semaphore = asyncio.Semaphore(max_inflight)
+    report = ctx.deps.step_status_callback or (lambda index, status: None)
+    bind = ctx.deps.db_session.get_bind()
+    results: list[StepResult] = [""] * len(plan.steps)
+
+    async def run_step(i: int) -> None:
+        step = plan.steps[i]
+        handler = _STEP_DISPATCH.get(step.agent)
+        if handler is None:
+            results[i] = f"Skipped: unknown agent '{step.agent}'"
+            return
+        async with semaphore:
+            report(i, "running")
+            try:
+                with Session(bind=bind, expire_on_commit=False) as session:
+                    results[i] = await handler(_step_context(ctx, session), step)
+            except Exception as e:
+                report(i, "failed")
+                results[i] = f"Failed: {e}"
+            else:
+                report(i, "completed")
+
+    batch: list[int] = []
+    for i, step in enumerate(plan.steps):
+        if not step.requires_approval:
+            batch.append(i)
+            continue
+
+        # Approval point: finish everything before it first
+        await asyncio.gather(*(run_step(j) for j in batch))
+        batch.clear()
+        ctx.deps.progress_callback("Approval Required", step.description)
+        if await ctx.deps.approval_callback(step.description, step.inputs):
+            await run_step(i)
+        else:
+            results[i] = "Skipped: not approved by researcher"
+    await asyncio.gather(*(run_step(j) for j in batch))
+
+    return results
+
+
+@orchestrator_agent.tool
+async def delegate_plan_steps(
+    ctx: RunContext[AgentDeps],
+    plan: TaskPlan,
+) -> list[StepResult]:
+    """Execute every step of an approved plan, running independent steps in parallel.
+
+    Pass the approved plan with its steps in the original order. Steps
+    marked as requiring approval are confirmed with the researcher when
+    reached; the steps before them finish first.
+
+    Args:
+        plan: The approved plan to execute.
+
+    Returns:
+        One result per step, in plan order.
+    """
+    return await run_plan_parallel(ctx, plan)
@@ -1,9 +1,16 @@
 """Project Manager agent for cost and timeline estimation."""
 
+import asyncio
+import csv
+import math
+from pathlib import Path
+
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 
-from .base import AgentDeps
+from src.services.export_service import EXPORT_BUFFER_SIZE
+
+from .base import AgentDeps, build_instructions
 
 
 class CostEstimate(BaseModel):
@@ -68,12 +75,7 @@ When creating CSV exports:
 
 def _get_project_manager_instructions(ctx: RunContext[AgentDeps]) -> str:
     """Return project manager instructions, appending any user customizations."""
-    from src.services.prompt_store import PromptStore
-
-    custom = PromptStore().get("project_manager")
-    if custom:
-        return PROJECT_MANAGER_INSTRUCTIONS + f"\n\n## Additional User Instructions\n{custom}"
-    return PROJECT_MANAGER_INSTRUCTIONS
+    return build_instructions("project_manager", PROJECT_MANAGER_INSTRUCTIONS)
 
 
 project_manager_agent = Agent(
@@ -83,6 +85,28 @@ project_manager_agent = Agent(
 )
 
 
+COST_CSV_FIELDS = ("category", "description", "amount", "currency", "source", "confidence")
+_COST_CSV_FIELD_SET = frozenset(COST_CSV_FIELDS)
+
+
+def _cost_row(cost: dict) -> tuple:
+    """Return *cost* as a CSV row, rejecting keys outside ``COST_CSV_FIELDS``."""
+    if not cost.keys() <= _COST_CSV_FIELD_SET:
+        extra = ", ".join(repr(key) for key in cost if key not in _COST_CSV_FIELD_SET)
+        raise ValueError(f"dict contains fields not in fieldnames: {extra}")
+    return tuple(cost.get(field, "") for field in COST_CSV_FIELDS)
+
+
+def _write_costs_csv(filepath: Path, costs: list[dict]) -> None:
+    """Write cost rows to *filepath* in ``COST_CSV_FIELDS`` column order."""
+    with open(
+        filepath, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(COST_CSV_FIELDS)
+        writer.writerows(_cost_row(cost) for cost in costs)
+
+
 @project_manager_agent.tool
 async def export_costs_to_csv(
     ctx: RunContext[AgentDeps],
@@ -98,21 +122,11 @@ async def export_costs_to_csv(
     Returns:
         Path to the created CSV file.
     """
-    import csv
-    from pathlib import Path
-
-    filepath = Path(ctx.deps.workspace_path) / filename
+    filepath = ctx.deps.workspace_dir / filename
     if not filename.endswith(".csv"):
         filepath = filepath.with_suffix(".csv")
 
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["category", "description", "amount", "currency", "source", "confidence"],
-        )
-        writer.writeheader()
-        for cost in costs:
-            writer.writerow(cost)
+    await asyncio.to_thread(_write_costs_csv, filepath, costs)
 
     ctx.deps.progress_callback("Export Complete", f"Cost breakdown saved to {filepath.name}")
     return str(filepath)
@@ -133,7 +147,7 @@ async def calculate_totals(
     Returns:
         Dictionary with subtotal, contingency, and total amounts.
     """
-    subtotal = sum(c.get("amount", 0) for c in costs)
+    subtotal = math.fsum(c.get("amount", 0) for c in costs)
     contingency = subtotal * (contingency_percent / 100)
     total = subtotal + contingency
 
@@ -9,6 +9,8 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from PySide6.QtWidgets import QApplication, QMessageBox
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
 
 from src.utils.config import load_config
 from src.utils.logging import setup_logging, get_logger
@@ -28,7 +30,14 @@ def create_or_load_project(db_session, workspace_manager: WorkspaceManager) -> P
         Project instance.
     """
     # Check for existing projects
-    existing = db_session.query(Project).order_by(Project.updated_at.desc()).first()
+    # Served by the updated_at index instead of sorting the whole table; only
+    # the columns used at startup are loaded, the rest load on access
+    existing = db_session.scalars(
+        select(Project)
+        .options(load_only(Project.id, Project.name, Project.workspace_path))
+        .order_by(Project.updated_at.desc())
+        .limit(1)
+    ).first()
 
     if existing:
         # Verify workspace exists
@@ -102,12 +111,16 @@ def main():
         )
         coordinator.task_changed.connect(window.status_panel.set_current_task)
         coordinator.history_entry.connect(window.status_panel.add_history_entry)
+        coordinator.history_batch.connect(window.status_panel.add_history_entries)
 
         # Set initial workspace in UI
         window.workspace_panel.set_workspace(project.workspace_path)
 
         window.show()
 
+        # Load the agent stack in the background while the window is idle
+        coordinator.preload()
+
         # Show welcome message
         window.chat_panel.append_message(
             "Assistant",
@@ -139,6 +152,7 @@ def main():
 
         # Run application
         exit_code = app.exec()
+        coordinator.shutdown()
 
     except Exception as e:
         logger.error(f"Application error: {e}", exc_info=True)
@@ -1,5 +1,12 @@
 """MCP server configuration and management."""
 
-from .config import create_mcp_toolsets, MCPToolsets
+from .config import create_mcp_toolsets, LazyMCPServer, MCPToolsets
+from .registry import MCPProcessRegistry, mcp_registry
 
-__all__ = ["create_mcp_toolsets", "MCPToolsets"]
+__all__ = [
+    "create_mcp_toolsets",
+    "LazyMCPServer",
+    "MCPToolsets",
+    "MCPProcessRegistry",
+    "mcp_registry",
+]
@@ -1,57 +1,409 @@
 """MCP server configuration and loader."""
 
+import asyncio
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from pydantic import TypeAdapter, ValidationError
+from pydantic_ai import RunContext
 from pydantic_ai.mcp import MCPServerStdio
+from pydantic_ai.tools import ToolDefinition
+from pydantic_ai.toolsets import ToolsetTool, WrapperToolset
+
+from src.utils.config import get_config
+from src.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# npm packages providing the stdio MCP servers
+FILESYSTEM_SERVER_PACKAGE = "@modelcontextprotocol/server-filesystem"
+BRAVE_SEARCH_SERVER_PACKAGE = "@modelcontextprotocol/server-brave-search"
+
+# Prompt keywords suggesting a server's tools will be needed; matching
+# servers are started while the model works on its first response
+MCP_PREWARM_TRIGGERS: dict[str, tuple[str, ...]] = {
+    "filesystem": ("file", "folder", "workspace", "document", "save", "export", "read"),
+    "web_search": ("search", "web", "look up", "lookup", "latest", "online"),
+}
+
+# Tool definitions reported by each server, keyed by server command line.
+# Lets later runs advertise a server's tools without starting it first.
+_tool_definitions: dict[tuple[str, ...], dict[str, ToolDefinition]] = {}
+
+# Joins a command line into a JSON object key for the on-disk cache
+_KEY_SEP = "\x1f"
+_SCHEMA_ADAPTER = TypeAdapter(dict[str, dict[str, ToolDefinition]])
+
+
+class MCPSchemaCache:
+    """Tool definitions persisted across launches, served stale-while-revalidate.
+
+    Definitions loaded from disk are used right away, so the first run of a
+    session doesn't have to start a server just to list its tools. They stay
+    marked stale until the server is started for a tool call, at which point
+    it is listed again in the background and the result replaces them.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self._path = path
+        self._loaded = False
+        self._stale: set[tuple[str, ...]] = set()
+        self._write_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Location of the cache file."""
+        if self._path is None:
+            self._path = get_config().app_data_dir / "mcp_schemas.json"
+        return self._path
+
+    def load(self) -> None:
+        """Merge cached definitions from disk into memory, once per process."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = _SCHEMA_ADAPTER.validate_json(self.path.read_bytes())
+        except (OSError, ValidationError) as e:
+            logger.debug(f"No usable MCP schema cache: {e!r}")
+            return
+        for key_str, tool_defs in data.items():
+            key = tuple(key_str.split(_KEY_SEP))
+            if key not in _tool_definitions:
+                _tool_definitions[key] = tool_defs
+                self._stale.add(key)
+
+    def claim_stale(self, key: tuple[str, ...]) -> bool:
+        """Return True (once) if *key* was served from disk and needs a refresh."""
+        if key in self._stale:
+            self._stale.discard(key)
+            return True
+        return False
+
+    async def store(self, key: tuple[str, ...], tool_defs: dict[str, ToolDefinition]) -> None:
+        """Record fresh definitions for *key* and write the cache file.
+
+        Args:
+            key: Server command line.
+            tool_defs: Tool definitions reported by the server.
+        """
+        _tool_definitions[key] = tool_defs
+        self._stale.discard(key)
+        payload = _SCHEMA_ADAPTER.dump_json(
+            {_KEY_SEP.join(k): v for k, v in _tool_definitions.items()}
+        )
+        try:
+            await asyncio.to_thread(self._write, payload)
+        except OSError as e:
+            logger.warning(f"Could not write MCP schema cache: {e!r}")
+
+    def _write(self, payload: bytes) -> None:
+        """Atomically replace the cache file with *payload*."""
+        with self._write_lock:
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, self.path)
+
+
+# Global schema cache instance
+schema_cache = MCPSchemaCache()
+
+
+async def _host_server(
+    server: MCPServerStdio,
+    ready: asyncio.Future,
+    stop: asyncio.Event,
+) -> None:
+    """Keep *server* running until *stop* is set.
+
+    MCP stdio clients must be entered and exited from the same task, so each
+    server gets a dedicated host task; this is what lets them start
+    concurrently. ``ready`` resolves once the server is initialized, or
+    carries the startup error.
+    """
+    try:
+        async with server:
+            if ready.cancelled():
+                # Whoever started us stopped waiting
+                return
+            ready.set_result(server)
+            await stop.wait()
+    except BaseException as exc:
+        if ready.done():
+            raise
+        if isinstance(exc, asyncio.CancelledError):
+            ready.cancel()
+            raise
+        ready.set_exception(exc)
+
+
+@dataclass(eq=False)
+class _ServerProcess:
+    """Runtime state of one MCP server subprocess.
+
+    Shared by every ``LazyMCPServer`` handed out for the server, including
+    the copies pydantic-ai makes of each toolset at the start of a run, so
+    they all start, use and stop the same subprocess.
+    """
+
+    host: asyncio.Task | None = None
+    stop: asyncio.Event = field(default_factory=asyncio.Event)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    error: BaseException | None = None
+    prewarm: asyncio.Task | None = None
+    revalidate: asyncio.Task | None = None
+
+
+@dataclass
+class LazyMCPServer(WrapperToolset):
+    """MCP server toolset that only starts its subprocess when needed.
+
+    Tool definitions are remembered per server command line. Once a server
+    has been listed, later runs advertise its tools from that cache and the
+    subprocess is started on the first actual tool call, so prompts that
+    never use a tool never pay the ``npx`` startup cost. A server that fails
+    to start contributes no tools instead of failing the whole run.
+
+    The subprocess state lives in ``process``, which copies of the toolset
+    share; ``on_failure`` belongs to each holder.
+    """
+
+    wrapped: MCPServerStdio
+    name: str = ""
+    on_failure: Callable[[str, BaseException], None] | None = None
+    process: _ServerProcess = field(default_factory=_ServerProcess, repr=False)
+    _failure_reported: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def failed(self) -> bool:
+        """Whether the server failed to start."""
+        return self.process.error is not None
+
+    @property
+    def running(self) -> bool:
+        """Whether the server's host task is up."""
+        return self.process.host is not None
+
+    @property
+    def cache_key(self) -> tuple[str, ...]:
+        return (self.wrapped.command, *self.wrapped.args)
+
+    async def __aenter__(self) -> "LazyMCPServer":
+        # Starting is deferred to _ensure_started()
+        return self
+
+    async def __aexit__(self, *args: Any) -> bool | None:
+        return None
+
+    async def _ensure_started(self) -> None:
+        """Start the server in its host task if it is not running yet."""
+        process = self.process
+        async with process.lock:
+            if process.error is not None:
+                raise process.error
+            if process.host is not None:
+                return
+            ready = asyncio.get_running_loop().create_future()
+            process.host = asyncio.create_task(
+                _host_server(self.wrapped, ready, process.stop)
+            )
+            try:
+                await ready
+            except BaseException as exc:
+                # Either startup failed or we were cancelled while waiting;
+                # don't leave a dead host behind for later calls to trust
+                host, process.host = process.host, None
+                if isinstance(exc, Exception):
+                    process.error = exc
+                else:
+                    host.cancel()
+                raise
+
+    def _report_failure(self, exc: BaseException) -> None:
+        """Log a startup failure and notify ``on_failure``, once per holder."""
+        if self._failure_reported:
+            return
+        self._failure_reported = True
+        logger.warning(f"MCP server '{self.name}' failed to start: {exc!r}")
+        if self.on_failure is not None:
+            self.on_failure(self.name, exc)
+
+    def prewarm(self) -> None:
+        """Start the server in the background ahead of its first tool call.
+
+        Startup errors are recorded as usual and surface on first use.
+        """
+        process = self.process
+        if process.host is not None or process.error is not None:
+            return
+        if process.prewarm is not None and not process.prewarm.done():
+            return
+        process.prewarm = asyncio.create_task(self._ensure_started())
+        # Retrieve the exception so an unused failure isn't reported as unhandled
+        process.prewarm.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def get_tools(self, ctx: RunContext[Any]) -> dict[str, ToolsetTool[Any]]:
+        tool_defs = _tool_definitions.get(self.cache_key)
+        if tool_defs is None:
+            try:
+                await self._ensure_started()
+            except Exception as exc:
+                self._report_failure(exc)
+                return {}
+            tools = await self.wrapped.get_tools(ctx)
+            await schema_cache.store(
+                self.cache_key, {name: tool.tool_def for name, tool in tools.items()}
+            )
+            return tools
+        return {name: self.wrapped.tool_for_tool_def(tool_def) for name, tool_def in tool_defs.items()}
+
+    async def call_tool(
+        self,
+        name: str,
+        tool_args: dict[str, Any],
+        ctx: RunContext[Any],
+        tool: ToolsetTool[Any],
+    ) -> Any:
+        await self._ensure_started()
+        if schema_cache.claim_stale(self.cache_key):
+            self.process.revalidate = asyncio.create_task(self._revalidate(ctx))
+        return await self.wrapped.call_tool(name, tool_args, ctx, tool)
+
+    async def _revalidate(self, ctx: RunContext[Any]) -> None:
+        """Refresh definitions that were served from the on-disk cache."""
+        try:
+            tools = await self.wrapped.get_tools(ctx)
+        except Exception as e:
+            # Keep serving the stale definitions
+            logger.debug(f"Could not refresh tools for MCP server '{self.name}': {e!r}")
+            return
+        await schema_cache.store(
+            self.cache_key, {name: tool.tool_def for name, tool in tools.items()}
+        )
+
+    async def aclose(self) -> None:
+        """Stop the server if it was started."""
+        process = self.process
+        process.stop.set()
+        if process.prewarm is not None:
+            await asyncio.gather(process.prewarm, return_exceptions=True)
+        if process.host is not None:
+            await asyncio.gather(process.host, return_exceptions=True)
+            process.host = None
 
 
 @dataclass
 class MCPToolsets:
-    """Container for MCP server connections."""
+    """Container for MCP server connections.
 
-    filesystem: MCPServerStdio | None = None
-    web_search: MCPServerStdio | None = None
+    Servers are shared through the MCP process registry and started lazily
+    by their ``LazyMCPServer`` wrappers; call ``aclose()`` to release them.
+    """
+
+    filesystem: LazyMCPServer | None = None
+    web_search: LazyMCPServer | None = None
     email: Any | None = None  # MCPServerHTTP when available
 
+    def prewarm_for_prompt(self, prompt: str) -> None:
+        """Start servers whose trigger keywords appear in *prompt*.
+
+        Args:
+            prompt: The user's prompt.
+        """
+        text = prompt.lower()
+        for name, triggers in MCP_PREWARM_TRIGGERS.items():
+            server = getattr(self, name, None)
+            if server is not None and any(t in text for t in triggers):
+                server.prewarm()
+
+    async def aclose(self, idle_timeout: float | None = None) -> None:
+        """Release this container's servers back to the registry.
+
+        Args:
+            idle_timeout: Seconds to keep a server running once no toolsets
+                hold it; ``0`` stops it immediately and ``None`` uses the
+                registry default.
+        """
+        from .registry import mcp_registry
+
+        servers = [s for s in (self.filesystem, self.web_search) if s is not None]
+        self.filesystem = self.web_search = None
+        await asyncio.gather(
+            *(mcp_registry.release(s, idle_timeout) for s in servers),
+            return_exceptions=True,
+        )
+
 
 def create_mcp_toolsets(
     workspace_path: str | Path,
     npx_available: bool = True,
+    on_failure: Callable[[str, BaseException], None] | None = None,
 ) -> MCPToolsets:
     """Create MCP server connections for agent use.
 
+    Tool definitions cached on disk by earlier sessions are loaded on first
+    call. Servers are acquired from the shared MCP process registry, so
+    coordinators on the same workspace reuse one subprocess per server type.
+    No subprocess is started here. Each server starts on first use; servers
+    whose tools have not been listed yet start when the agent run lists its
+    tools, concurrently with each other. Must be called from the event loop
+    the servers will run on.
+
     Args:
         workspace_path: Path to the workspace directory for filesystem access.
         npx_available: Whether npx is available on the system.
+        on_failure: Called with the server name and error if a server fails
+            to start.
 
     Returns:
         MCPToolsets containing configured MCP servers.
     """
+    from .registry import mcp_registry
+
     if not npx_available:
         return MCPToolsets()
 
+    schema_cache.load()
+
     workspace_path = str(Path(workspace_path).resolve())
 
     # Filesystem MCP server - always available
     # timeout=30 because npx may need to download the package on first run
-    filesystem = MCPServerStdio(
-        "npx",
-        args=["-y", "@modelcontextprotocol/server-filesystem", workspace_path],
-        timeout=30,
+    filesystem = mcp_registry.acquire(
+        "filesystem",
+        workspace_path,
+        lambda: LazyMCPServer(
+            MCPServerStdio(
+                "npx",
+                args=["-y", FILESYSTEM_SERVER_PACKAGE, workspace_path],
+                timeout=30,
+            ),
+            name="filesystem",
+        ),
+        on_failure,
     )
 
     # Web search MCP server - requires BRAVE_API_KEY
     web_search = None
     brave_api_key = os.environ.get("BRAVE_API_KEY")
     if brave_api_key:
-        web_search = MCPServerStdio(
-            "npx",
-            args=["-y", "@modelcontextprotocol/server-brave-search"],
-            env={"BRAVE_API_KEY": brave_api_key},
-            timeout=30,
+        web_search = mcp_registry.acquire(
+            "web_search",
+            workspace_path,
+            lambda: LazyMCPServer(
+                MCPServerStdio(
+                    "npx",
+                    args=["-y", BRAVE_SEARCH_SERVER_PACKAGE],
+                    env={"BRAVE_API_KEY": brave_api_key},
+                    timeout=30,
+                ),
+                name="web_search",
+            ),
+            on_failure,
         )
 
     return MCPToolsets(
@@ -0,0 +1,118 @@
+"""Process-wide registry of shared MCP server processes."""
+
+import asyncio
+from dataclasses import dataclass, replace
+from typing import Callable
+
+from .config import LazyMCPServer
+
+# Seconds an unused server is kept alive before its subprocess is stopped
+DEFAULT_IDLE_TIMEOUT = 60.0
+
+
+@dataclass
+class _RefCountedServer:
+    """A shared server and the number of toolsets currently holding it.
+
+    ``server`` is the prototype; holders get copies of it that share its
+    subprocess state.
+    """
+
+    server: LazyMCPServer
+    refs: int = 0
+    idle_handle: asyncio.TimerHandle | None = None
+
+
+class MCPProcessRegistry:
+    """Hands out shared, reference-counted MCP servers.
+
+    Servers are keyed by ``(server_type, workspace_path)`` and by the event
+    loop they run on, so every coordinator working on the same workspace
+    shares one subprocess per server type instead of spawning its own. When
+    the last holder releases a server it is kept for an idle period before
+    its subprocess is stopped.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, _RefCountedServer] = {}
+        # Shutdowns started by idle expiry, kept referenced until they finish
+        self._closing: set[asyncio.Task] = set()
+
+    def acquire(
+        self,
+        server_type: str,
+        workspace_path: str,
+        factory: Callable[[], LazyMCPServer],
+        on_failure: Callable[[str, BaseException], None] | None = None,
+    ) -> LazyMCPServer:
+        """Return a handle on the shared server for *server_type* and *workspace_path*.
+
+        Args:
+            server_type: Kind of server (e.g. ``"filesystem"``).
+            workspace_path: Resolved workspace path the server is scoped to.
+            factory: Builds a new server if none is shared yet.
+            on_failure: Failure callback for this holder only.
+
+        Returns:
+            A handle sharing the server's subprocess; release it with
+            ``release()`` when done.
+        """
+        key = (asyncio.get_running_loop(), server_type, workspace_path)
+        entry = self._entries.get(key)
+        if entry is None or entry.server.failed:
+            entry = self._entries[key] = _RefCountedServer(factory())
+        if entry.idle_handle is not None:
+            entry.idle_handle.cancel()
+            entry.idle_handle = None
+        entry.refs += 1
+        return replace(entry.server, on_failure=on_failure)
+
+    async def release(
+        self,
+        server: LazyMCPServer,
+        idle_timeout: float | None = None,
+    ) -> None:
+        """Drop one reference to *server*.
+
+        Args:
+            server: A server returned by ``acquire()``.
+            idle_timeout: Seconds to keep the server once unused; ``0`` stops
+                it immediately and ``None`` uses ``DEFAULT_IDLE_TIMEOUT``.
+        """
+        if idle_timeout is None:
+            idle_timeout = DEFAULT_IDLE_TIMEOUT
+
+        key = next(
+            (k for k, e in self._entries.items() if e.server.process is server.process),
+            None,
+        )
+        if key is None:
+            await server.aclose()
+            return
+
+        entry = self._entries[key]
+        entry.refs -= 1
+        if entry.refs > 0:
+            return
+
+        if idle_timeout <= 0 or server.failed:
+            del self._entries[key]
+            await entry.server.aclose()
+        else:
+            entry.idle_handle = asyncio.get_running_loop().call_later(
+                idle_timeout, self._expire, key
+            )
+
+    def _expire(self, key: tuple) -> None:
+        """Stop a server whose idle period ran out."""
+        entry = self._entries.get(key)
+        if entry is None or entry.refs > 0:
+            return
+        del self._entries[key]
+        task = asyncio.get_running_loop().create_task(entry.server.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+
+# Global registry instance
+mcp_registry = MCPProcessRegistry()
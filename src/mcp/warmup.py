@@ -0,0 +1,60 @@
+"""Background warm-up of the npm cache for MCP server packages."""
+
+import asyncio
+import os
+import shutil
+
+from src.utils.logging import get_logger
+
+from .config import BRAVE_SEARCH_SERVER_PACKAGE, FILESYSTEM_SERVER_PACKAGE
+
+
+logger = get_logger(__name__)
+
+
+async def _warm_package(npx: str, package: str, timeout: float) -> None:
+    """Fetch *package* into the npx cache without starting its server.
+
+    Runs ``node --version`` from the package environment, which makes npx
+    download and install the package but exits immediately.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            npx, "-y", "--prefer-offline", "-p", package, "node", "--version",
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError as e:
+        logger.debug(f"Could not warm npx cache for {package}: {e}")
+        return
+
+    try:
+        await asyncio.wait_for(proc.wait(), timeout)
+    except asyncio.TimeoutError:
+        logger.debug(f"Timed out warming npx cache for {package}")
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+
+async def warm_npx_cache(timeout: float = 120.0) -> None:
+    """Download the MCP server packages ahead of their first use.
+
+    On a cold npm cache ``npx -y`` downloads the package while the server is
+    starting, which can exceed the server start timeout. Warming the cache
+    in the background makes the first agent run start its servers quickly.
+
+    Args:
+        timeout: Maximum seconds to spend on each package.
+    """
+    npx = shutil.which("npx")
+    if npx is None:
+        return
+
+    packages = [FILESYSTEM_SERVER_PACKAGE]
+    if os.environ.get("BRAVE_API_KEY"):
+        packages.append(BRAVE_SEARCH_SERVER_PACKAGE)
+
+    await asyncio.gather(*(_warm_package(npx, p, timeout) for p in packages))
@@ -1,6 +1,6 @@
 """Database models for the Clinical Research Assistant."""
 
-from .database import Base, get_engine, get_session, init_db
+from .database import Base, get_engine, get_session, get_session_factory, init_db
 from .project import Project
 from .agent_run import AgentRun
 from .approval import Approval
@@ -10,6 +10,7 @@ __all__ = [
     "Base",
     "get_engine",
     "get_session",
+    "get_session_factory",
     "init_db",
     "Project",
     "AgentRun",
@@ -1,8 +1,9 @@
 """Agent run model for tracking agent execution history."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship, deferred
 
 from .database import Base
 
@@ -11,17 +12,22 @@ class AgentRun(Base):
     """Record of an agent execution."""
 
     __tablename__ = "agent_runs"
+    __table_args__ = (
+        # Latest runs for a project; also serves plain project_id lookups
+        Index("ix_runs_project_started", "project_id", "started_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
     agent_type = Column(String(50), nullable=False)  # orchestrator, project_manager, etc.
     prompt = Column(Text, nullable=False)
-    output = Column(JSON)
-    status = Column(String(20), default="pending")  # pending, running, completed, failed
-    error_message = Column(Text)
+    # Large payloads are loaded on first access, not with every row
+    output = deferred(Column(JSON))
+    status = Column(String(20), default="pending", index=True)  # pending, running, completed, failed
+    error_message = deferred(Column(Text))
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
-    token_usage = Column(JSON)  # {prompt_tokens, completion_tokens, total_tokens}
+    token_usage = deferred(Column(JSON))  # {prompt_tokens, completion_tokens, total_tokens}
 
     # Relationships
     project = relationship("Project", back_populates="runs")
@@ -30,19 +36,19 @@ class AgentRun(Base):
     def __repr__(self) -> str:
         return f"<AgentRun(id={self.id}, agent_type='{self.agent_type}', status='{self.status}')>"
 
-    def start(self) -> None:
-        """Mark the run as started."""
+    def start(self, now: datetime | None = None) -> None:
+        """Mark the run as started, at *now* if given."""
         self.status = "running"
-        self.started_at = datetime.utcnow()
+        self.started_at = now or datetime.utcnow()
 
-    def complete(self, output: dict | str) -> None:
-        """Mark the run as completed with output."""
+    def complete(self, output: dict | str, now: datetime | None = None) -> None:
+        """Mark the run as completed with output, at *now* if given."""
         self.status = "completed"
-        self.completed_at = datetime.utcnow()
+        self.completed_at = now or datetime.utcnow()
         self.output = output if isinstance(output, dict) else {"result": output}
 
-    def fail(self, error: str) -> None:
-        """Mark the run as failed with error message."""
+    def fail(self, error: str, now: datetime | None = None) -> None:
+        """Mark the run as failed with error message, at *now* if given."""
         self.status = "failed"
-        self.completed_at = datetime.utcnow()
+        self.completed_at = now or datetime.utcnow()
         self.error_message = error
@@ -2,10 +2,13 @@
 
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 
 from .database import Base
 
+# Display status for each value of Approval.approved
+_STATUS = {True: "approved", False: "denied", None: "pending"}
+
 
 class Approval(Base):
     """Record of a human approval decision."""
@@ -13,9 +16,9 @@ class Approval(Base):
     __tablename__ = "approvals"
 
     id = Column(Integer, primary_key=True)
-    agent_run_id = Column(Integer, ForeignKey("agent_runs.id"), nullable=False)
+    agent_run_id = Column(Integer, ForeignKey("agent_runs.id"), nullable=False, index=True)
     action_description = Column(Text, nullable=False)
-    details = Column(JSON)
+    details = deferred(Column(JSON))
     approved = Column(Boolean)
     researcher_notes = Column(Text)
     requested_at = Column(DateTime, default=datetime.utcnow)
@@ -25,19 +28,18 @@ class Approval(Base):
     agent_run = relationship("AgentRun", back_populates="approvals")
 
     def __repr__(self) -> str:
-        status = "approved" if self.approved else "denied" if self.approved is False else "pending"
-        return f"<Approval(id={self.id}, status='{status}')>"
+        return f"<Approval(id={self.id}, status='{_STATUS[self.approved]}')>"
 
-    def approve(self, notes: str | None = None) -> None:
-        """Mark as approved."""
+    def approve(self, notes: str | None = None, now: datetime | None = None) -> None:
+        """Mark as approved, at *now* if given."""
         self.approved = True
-        self.decided_at = datetime.utcnow()
+        self.decided_at = now or datetime.utcnow()
         if notes:
             self.researcher_notes = notes
 
-    def deny(self, notes: str | None = None) -> None:
-        """Mark as denied."""
+    def deny(self, notes: str | None = None, now: datetime | None = None) -> None:
+        """Mark as denied, at *now* if given."""
         self.approved = False
-        self.decided_at = datetime.utcnow()
+        self.decided_at = now or datetime.utcnow()
         if notes:
             self.researcher_notes = notes
@@ -1,7 +1,9 @@
 """SQLite database connection and session management."""
 
 from pathlib import Path
-from sqlalchemy import create_engine
+
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from typing import Generator
 
@@ -10,6 +12,32 @@ Base = declarative_base()
 _engine = None
 _SessionLocal = None
 
+# Applied to every new SQLite connection. WAL lets UI reads proceed while the
+# agent thread commits, and synchronous=NORMAL is safe under WAL while
+# avoiding an fsync per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",  # ~20 MB
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+
+
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to a newly opened connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 def get_engine(db_path: str | Path | None = None):
     """Get or create the database engine."""
@@ -24,17 +52,32 @@ def get_engine(db_path: str | Path | None = None):
             f"sqlite:///{db_path}",
             connect_args={"check_same_thread": False},
             echo=False,
+            # JSON columns (run output, token usage, details) go through orjson
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
         )
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
     return _engine
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Get a database session."""
+def get_session_factory() -> sessionmaker:
+    """Get the session factory bound to the database engine."""
     global _SessionLocal
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+        # expire_on_commit=False keeps loaded attributes valid after each commit,
+        # so agent runs that commit repeatedly don't re-SELECT the same rows
+        _SessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=get_engine(),
+        )
+    return _SessionLocal
+
 
-    session = _SessionLocal()
+def get_session() -> Generator[Session, None, None]:
+    """Get a database session."""
+    session = get_session_factory()()
     try:
         yield session
     finally:
@@ -49,3 +92,9 @@ def init_db(db_path: str | Path | None = None) -> None:
     from . import project, agent_run, approval, document  # noqa: F401
 
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips tables that already exist, so add any indexes that
+    # were introduced after an existing database was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 
 from .database import Base
 
@@ -13,12 +13,12 @@ class Document(Base):
     __tablename__ = "documents"
 
     id = Column(Integer, primary_key=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
     document_type = Column(String(100), nullable=False)  # ICF, Protocol, IB, etc.
     title = Column(String(255), nullable=False)
     file_path = Column(String(500), nullable=False)
     created_by_agent = Column(String(50))  # Which agent created it
-    extra_data = Column(JSON)  # Additional document-specific metadata
+    extra_data = deferred(Column(JSON))  # Additional document-specific metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -16,8 +16,8 @@ class Project(Base):
     name = Column(String(255), nullable=False)
     description = Column(Text)
     workspace_path = Column(String(500), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     runs = relationship("AgentRun", back_populates="project", cascade="all, delete-orphan")
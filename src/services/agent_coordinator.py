@@ -1,139 +1,278 @@
 """Agent coordinator service for managing agent execution."""
 
 import asyncio
-import traceback
+import concurrent.futures
+import re
+import threading
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-from PySide6.QtCore import QObject, Signal, Slot, QThread
+from pydantic import BaseModel
+from PySide6.QtCore import QObject, Qt, Signal, Slot, QThread
 from sqlalchemy.orm import Session
 
-from mcp.shared.exceptions import McpError
-
-from src.agents import orchestrator_agent, AgentDeps
-from src.mcp import create_mcp_toolsets, MCPToolsets
-from src.models import AgentRun, Approval
+from src.models import AgentRun, Approval, get_session_factory
 from src.utils.config import get_config
+from src.utils.logging import get_logger
+
+
+logger = get_logger(__name__)
 
 
 def _format_error(exc: BaseException) -> str:
     """Format an exception into a descriptive error string.
 
-    Unwraps ExceptionGroups so the real causes are visible.
+    Lists the type and message of the exception and its explicit causes,
+    without tracebacks (those are logged instead). Unwraps ExceptionGroups
+    so the real causes are visible.
     """
     if isinstance(exc, BaseExceptionGroup):
         parts = [f"{type(exc).__name__}: {exc}"]
         for i, sub in enumerate(exc.exceptions, 1):
-            tb = "".join(traceback.format_exception(type(sub), sub, sub.__traceback__))
-            parts.append(f"\n--- Sub-exception {i} ---\n{tb}")
+            parts.append(f"--- Sub-exception {i} ---\n{_format_error(sub)}")
         return "\n".join(parts)
-    return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+    text = f"{type(exc).__name__}: {exc}"
+    if exc.__cause__ is not None:
+        text += f"\nCaused by: {_format_error(exc.__cause__)}"
+    return text
+
+
+def _is_cancellation(exc: BaseException) -> bool:
+    """Check whether an exception only reports task cancellation.
+
+    True for CancelledError and for ExceptionGroups (e.g. from task groups
+    torn down mid-run) made up entirely of cancellations.
+    """
+    if isinstance(exc, BaseExceptionGroup):
+        return all(_is_cancellation(sub) for sub in exc.exceptions)
+    return isinstance(exc, asyncio.CancelledError)
+
+
+@lru_cache(maxsize=1)
+def _mcp_error_types() -> tuple[type[BaseException], ...]:
+    """Exception types treated as MCP server failures.
+
+    Built on first use so the MCP client isn't imported at startup.
+    """
+    from mcp.shared.exceptions import McpError
+
+    return (TimeoutError, FileNotFoundError, ConnectionError, OSError, McpError)
 
 
 def _is_mcp_error(exc: BaseException) -> bool:
     """Check whether an exception was caused by MCP server startup failure.
 
-    Recursively inspects ExceptionGroups for known MCP-related errors
-    (TimeoutError, FileNotFoundError, ConnectionError, OSError).
+    Walks ExceptionGroups and ``__cause__`` chains iteratively, visiting
+    each exception once, looking for known MCP-related errors (TimeoutError,
+    FileNotFoundError, ConnectionError, OSError).
     """
-    mcp_types = (TimeoutError, FileNotFoundError, ConnectionError, OSError, McpError)
-    if isinstance(exc, mcp_types):
-        return True
-    if isinstance(exc, BaseExceptionGroup):
-        return any(_is_mcp_error(sub) for sub in exc.exceptions)
-    if exc.__cause__ is not None:
-        return _is_mcp_error(exc.__cause__)
+    mcp_types = _mcp_error_types()
+    seen: set[int] = set()
+    stack = [exc]
+    while stack:
+        e = stack.pop()
+        if id(e) in seen:
+            continue
+        seen.add(id(e))
+        if isinstance(e, mcp_types):
+            return True
+        if isinstance(e, BaseExceptionGroup):
+            stack.extend(e.exceptions)
+        elif e.__cause__ is not None:
+            stack.append(e.__cause__)
     return False
 
 
+# Known error fragments, matched case-insensitively in a single pass
+_ERR_RE = re.compile(
+    r"(?P<npx>npx)"
+    r"|(?P<missing>not found|no such file)"
+    r"|(?P<timeout>timeout|timedout)"
+    r"|(?P<closed>connection closed)"
+    r"|(?P<auth>api_key|authentication|401)",
+    re.IGNORECASE,
+)
+
+# (fragments that must all be present, friendly message), in priority order
+_USER_ERRORS: tuple[tuple[frozenset[str], str], ...] = (
+    (
+        frozenset({"npx", "missing"}),
+        "Node.js (npx) is not installed or not on your PATH.\n"
+        "Install it from https://nodejs.org to enable MCP tools.\n"
+        "Agents will still work without tool access.",
+    ),
+    (
+        frozenset({"timeout"}),
+        "An MCP tool server timed out while starting. This can happen on "
+        "the first run while packages are downloaded.\n"
+        "The request will be retried without tools. You can try again later "
+        "once the packages are cached.",
+    ),
+    (
+        frozenset({"closed"}),
+        "An MCP tool server connection was lost. This can happen when "
+        "Node.js/npx has trouble keeping the server process alive.\n"
+        "The request will be retried without tools.",
+    ),
+    (
+        frozenset({"auth"}),
+        "API authentication failed. Please check that your ANTHROPIC_API_KEY "
+        "is set correctly in your .env file.",
+    ),
+)
+
+
 def _format_user_error(error: str) -> str:
     """Map known error patterns to user-friendly messages."""
-    lower = error.lower()
-    if "npx" in lower and ("not found" in lower or "no such file" in lower):
-        return (
-            "Node.js (npx) is not installed or not on your PATH.\n"
-            "Install it from https://nodejs.org to enable MCP tools.\n"
-            "Agents will still work without tool access."
-        )
-    if "timeout" in lower or "timedout" in lower:
-        return (
-            "An MCP tool server timed out while starting. This can happen on "
-            "the first run while packages are downloaded.\n"
-            "The request will be retried without tools. You can try again later "
-            "once the packages are cached."
-        )
-    if "connection closed" in lower:
-        return (
-            "An MCP tool server connection was lost. This can happen when "
-            "Node.js/npx has trouble keeping the server process alive.\n"
-            "The request will be retried without tools."
-        )
-    if "api_key" in lower or "authentication" in lower or "401" in lower:
-        return (
-            "API authentication failed. Please check that your ANTHROPIC_API_KEY "
-            "is set correctly in your .env file."
-        )
+    found = {m.lastgroup for m in _ERR_RE.finditer(error)}
+    if found:
+        for required, message in _USER_ERRORS:
+            if required <= found:
+                return message
     return error
 
 
-def _format_plan_message(plan_data: dict) -> str:
-    """Format a TaskPlan dict into a readable chat message."""
-    goal = plan_data.get("goal", "No goal specified")
-    steps = plan_data.get("steps", [])
-    agents = plan_data.get("estimated_agents", [])
+def _plan_step_lines(steps) -> tuple[list[str], list[str]]:
+    """Format plan steps for the chat message and the agent prompts.
+
+    Args:
+        steps: Step dicts of a TaskPlan.
 
-    lines = [f"<b>Plan: {goal}</b><br>"]
+    Returns:
+        Tuple of (HTML lines for the chat, plain-text lines for prompts),
+        built in one pass over the steps.
+    """
+    html_lines = []
+    text_lines = []
     for i, step in enumerate(steps, 1):
-        agent = step.get("agent", "unknown")
-        desc = step.get("description", "")
         approval = " ⚠ <i>requires approval</i>" if step.get("requires_approval") else ""
-        lines.append(f"{i}. [{agent}] {desc}{approval}")
+        html_lines.append(
+            f"{i}. [{step.get('agent', 'unknown')}] {step.get('description', '')}{approval}"
+        )
+        text_lines.append(f"  {i}. [{step.get('agent')}] {step.get('description')}")
+    return html_lines, text_lines
 
+
+def _format_plan_message(goal: str, step_lines: list[str], agents) -> str:
+    """Format a TaskPlan into a readable chat message.
+
+    Args:
+        goal: The plan goal.
+        step_lines: HTML step lines from ``_plan_step_lines``.
+        agents: Names of the agents involved.
+    """
+    lines = [f"<b>Plan: {goal}</b><br>", *step_lines]
     if agents:
         lines.append(f"<br><b>Agents involved:</b> {', '.join(agents)}")
-
     return "<br>".join(lines)
 
 
-class AgentWorker(QThread):
-    """Worker thread for running agents asynchronously."""
+@dataclass(slots=True, frozen=True)
+class PreparedPlan:
+    """A TaskPlan dict with the derived text the coordinator reuses.
 
-    finished = Signal(object)  # Result or error
-    error = Signal(str)
-    cancelled = Signal()
+    Built once when a plan arrives, so showing, executing and revising the
+    plan don't each walk its steps again.
+    """
+
+    raw: dict
+    goal: str
+    step_count: int
+    formatted_html: str
+    steps_text: str
+
+    @classmethod
+    def from_dict(cls, plan_data: dict) -> "PreparedPlan":
+        """Build a PreparedPlan from a TaskPlan dict.
+
+        Args:
+            plan_data: The plan as returned by ``TaskPlan.model_dump()``.
+
+        Returns:
+            The prepared plan.
+        """
+        steps = plan_data.get("steps", ())
+        html_lines, text_lines = _plan_step_lines(steps)
+        return cls(
+            raw=plan_data,
+            goal=plan_data.get("goal", ""),
+            step_count=len(steps),
+            formatted_html=_format_plan_message(
+                plan_data.get("goal", "No goal specified"),
+                html_lines,
+                plan_data.get("estimated_agents", ()),
+            ),
+            steps_text="\n".join(text_lines),
+        )
 
-    def __init__(self, coro):
+
+class AsyncRuntime(QThread):
+    """Background thread running one long-lived asyncio event loop.
+
+    Agent runs are submitted to the loop with ``submit()``, so the loop and
+    anything bound to it (MCP server subprocesses, HTTP connection pools)
+    persist across prompts.
+    """
+
+    def __init__(self):
         super().__init__()
-        self.coro = coro
-        self.loop: asyncio.AbstractEventLoop | None = None
-        self._task: asyncio.Task | None = None
-        self._cancelling = False
+        self.loop = asyncio.new_event_loop()
 
     def run(self):
-        """Run the coroutine in a new event loop."""
-        self.loop = asyncio.new_event_loop()
+        """Run the event loop until ``shutdown()`` is called."""
         asyncio.set_event_loop(self.loop)
-        self._task = self.loop.create_task(self.coro)
         try:
-            result = self.loop.run_until_complete(self._task)
-            self.finished.emit(result)
-        except asyncio.CancelledError:
-            self.cancelled.emit()
-        except BaseException as e:
-            if self._cancelling:
-                # Exception occurred during cancellation (e.g. MCP stdio
-                # teardown raising BrokenResourceError) — treat as cancel.
-                self.cancelled.emit()
-            else:
-                self.error.emit(_format_error(e))
+            self.loop.run_forever()
         finally:
+            # Cancel whatever is left (e.g. idle MCP servers) and let it
+            # clean up before closing the loop
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            self.loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True)
+            )
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
             self.loop.close()
 
-    def cancel(self):
-        """Request cancellation of the running task."""
-        if self.loop and self._task and not self._task.done():
-            self._cancelling = True
-            self.loop.call_soon_threadsafe(self._task.cancel)
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop from any thread.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            A future resolved with the coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def shutdown(self, timeout_ms: int = 5000) -> None:
+        """Stop the loop and wait for the thread to finish.
+
+        Args:
+            timeout_ms: Maximum time to wait for pending tasks to clean up.
+        """
+        if self.isRunning():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.wait(timeout_ms)
+
+
+_runtime: AsyncRuntime | None = None
+
+
+def get_async_runtime() -> AsyncRuntime:
+    """Get the shared async runtime, starting it on first use.
+
+    Returns:
+        The running AsyncRuntime instance.
+    """
+    global _runtime
+    if _runtime is None:
+        _runtime = AsyncRuntime()
+        _runtime.start()
+    return _runtime
 
 
 class AgentCoordinator(QObject):
@@ -148,31 +287,52 @@ class AgentCoordinator(QObject):
     approval_requested = Signal(str, dict)  # action, details
     question_asked = Signal(str, list)  # question text, options list
     plan_updated = Signal(dict)  # plan data
-    step_status_changed = Signal(int, str)  # step_index, status
+    steps_status_changed = Signal(object)  # {step_index: status}
     status_changed = Signal(str, str)  # status, agent
     task_changed = Signal(str)  # task description
     history_entry = Signal(str, str, str)  # agent, action, status
+    history_batch = Signal(list)  # [(agent, action, status), ...]
+
+    # Emitted from the runtime thread when a run ends; queued to the Qt thread
+    _run_done = Signal(object)  # concurrent.futures.Future
+    _progress_ready = Signal()
+    _step_updates_ready = Signal()
 
     def __init__(self, db_session: Session, project):
         super().__init__()
         self.db_session = db_session
+        self._session_factory = get_session_factory()
         self.project = project
+        self._config = get_config()
+        self._runtime = get_async_runtime()
         self._approval_event: asyncio.Event | None = None
         self._approval_result = False
         self._approval_notes = ""
         self._question_event: asyncio.Event | None = None
         self._question_answer: str = ""
-        self._current_worker: AgentWorker | None = None
+        # One researcher prompt at a time: steps running concurrently would
+        # otherwise replace each other's pending event
+        self._prompt_lock = asyncio.Lock()
+        self._current_future: concurrent.futures.Future | None = None
+        self._current_task: asyncio.Task | None = None
+        self._cancelling = False
         self._mcp_toolsets = None
-        self._pending_plan: dict | None = None
-        self._revision_plan: dict | None = None
-        self._executing_plan: dict | None = None
+        self._pending_plan: PreparedPlan | None = None
+        self._revision_plan: PreparedPlan | None = None
+        self._executing_plan: PreparedPlan | None = None
         self._current_step_index: int = -1
+        self._steps_reported_by_index = False
+        self._progress_lock = threading.Lock()
+        self._progress_buffer: list[tuple[str, str]] = []
+        self._pending_step_updates: dict[int, str] = {}
+        self._run_done.connect(self._on_run_done)
+        self._progress_ready.connect(self._flush_progress, Qt.QueuedConnection)
+        self._step_updates_ready.connect(self._flush_step_updates, Qt.QueuedConnection)
 
     def run_async(self, prompt: str) -> None:
         """Run the orchestrator agent with the given prompt.
 
-        This method starts the agent in a background thread and returns
+        This method schedules the agent on the shared runtime loop and returns
         immediately. Results are delivered via signals.
 
         If a revision plan is pending, the prompt is treated as feedback
@@ -181,7 +341,7 @@ class AgentCoordinator(QObject):
         Args:
             prompt: The user's prompt to process.
         """
-        if self._current_worker and self._current_worker.isRunning():
+        if self._current_future is not None:
             self.message_received.emit("System", "An agent is already running. Please wait.")
             return
 
@@ -190,18 +350,12 @@ class AgentCoordinator(QObject):
             prompt = self._build_revision_prompt(self._revision_plan, prompt)
             self._revision_plan = None
 
-        # Create the coroutine
-        coro = self._run_orchestrator(prompt)
-
-        # Create and start worker thread
-        self._current_worker = AgentWorker(coro)
-        self._current_worker.finished.connect(self._on_agent_finished)
-        self._current_worker.error.connect(self._on_agent_error)
-        self._current_worker.cancelled.connect(self._on_agent_cancelled)
-        self._current_worker.start()
+        self._cancelling = False
+        self._current_future = self._runtime.submit(self._run_orchestrator(prompt))
+        self._current_future.add_done_callback(self._run_done.emit)
 
         self.status_changed.emit("running", "Orchestrator")
-        self.task_changed.emit(prompt[:100] + "..." if len(prompt) > 100 else prompt)
+        self.task_changed.emit(prompt if len(prompt) <= 100 else f"{prompt[:100]}...")
 
     async def _run_orchestrator(self, prompt: str) -> Any:
         """Run the orchestrator agent with the given prompt.
@@ -210,91 +364,117 @@ class AgentCoordinator(QObject):
             prompt: The user's prompt to process.
 
         Returns:
-            The agent's result.
+            Tuple of the agent's result and, for a structured plan output,
+            its PreparedPlan (else None).
         """
-        # Store reference to the running loop for cross-thread approval signaling
-        if self._current_worker:
-            self._current_worker.loop = asyncio.get_running_loop()
-
-        # Create fresh MCP toolsets for each run.
-        # MCPServerStdio objects cannot be reused after agent.run() exits
-        # their async context and shuts down the subprocess.
-        self._mcp_toolsets = create_mcp_toolsets(
-            self.project.workspace_path,
-            npx_available=get_config().npx_available,
-        )
-
-        # Create agent run record
-        agent_run = AgentRun(
-            project_id=self.project.id,
-            agent_type="orchestrator",
-            prompt=prompt,
-            status="running",
-            started_at=datetime.utcnow(),
-        )
-        self.db_session.add(agent_run)
-        self.db_session.commit()
-
-        try:
-            deps = AgentDeps(
-                db_session=self.db_session,
-                workspace_path=self.project.workspace_path,
+        # Deferred so pydantic-ai and the MCP client load on the runtime
+        # thread, not during application startup
+        from src.agents import orchestrator_agent, AgentDeps, get_default_model
+        from src.mcp import create_mcp_toolsets, MCPToolsets
+
+        # Store the task so stop() can cancel it from the Qt thread
+        self._current_task = asyncio.current_task()
+
+        # Each run gets its own session on the runtime thread; the session
+        # passed to the coordinator stays with the Qt thread
+        with self._session_factory() as session:
+            # Create agent run record
+            agent_run = AgentRun(
                 project_id=self.project.id,
-                mcp_filesystem=self._mcp_toolsets.filesystem,
-                mcp_web_search=self._mcp_toolsets.web_search,
-                mcp_email=self._mcp_toolsets.email,
-                approval_callback=self._request_approval,
-                progress_callback=self._send_progress,
-                question_callback=self._ask_question,
+                agent_type="orchestrator",
+                prompt=prompt,
+                status="running",
+                started_at=datetime.utcnow(),
             )
+            session.add(agent_run)
+            session.commit()
 
-            # Run agent with MCP servers passed as toolsets
-            mcp_servers = deps.get_active_mcp_servers()
-
+            self._mcp_toolsets = MCPToolsets()
             try:
-                result = await orchestrator_agent.run(
-                    prompt,
-                    deps=deps,
-                    model=get_config().default_model,
-                    toolsets=mcp_servers,
-                )
-            except BaseException as mcp_exc:
-                if mcp_servers and _is_mcp_error(mcp_exc):
-                    # MCP server failed — notify user and retry without tools
-                    self._send_progress(
+                # Acquire MCP toolsets from the shared registry. Servers start
+                # lazily on first use and stay up briefly between prompts.
+                self._mcp_toolsets = create_mcp_toolsets(
+                    self.project.workspace_path,
+                    npx_available=self._config.npx_available,
+                    on_failure=lambda name, exc: self._send_progress(
                         "MCP Unavailable",
-                        "Tool servers failed to start. Retrying without tools...",
-                    )
-                    self._mcp_toolsets = MCPToolsets()
+                        f"The {name} tool server failed to start. Continuing without it...",
+                    ),
+                )
+                # Overlap likely-needed server startups with the first model call
+                self._mcp_toolsets.prewarm_for_prompt(prompt)
+
+                deps = AgentDeps(
+                    db_session=session,
+                    workspace_path=self.project.workspace_path,
+                    project_id=self.project.id,
+                    mcp_filesystem=self._mcp_toolsets.filesystem,
+                    mcp_web_search=self._mcp_toolsets.web_search,
+                    mcp_email=self._mcp_toolsets.email,
+                    approval_callback=self._request_approval,
+                    progress_callback=self._send_progress,
+                    question_callback=self._ask_question,
+                    step_status_callback=self._report_step_status,
+                )
+
+                # Run agent with MCP servers passed as toolsets; the retry
+                # below uses the same model
+                mcp_servers = deps.get_active_mcp_servers()
+                model = get_default_model()
+
+                try:
                     result = await orchestrator_agent.run(
                         prompt,
                         deps=deps,
-                        model=get_config().default_model,
+                        model=model,
+                        toolsets=mcp_servers,
                     )
+                except BaseException as mcp_exc:
+                    if mcp_servers and _is_mcp_error(mcp_exc):
+                        # MCP server failed — notify user and retry without tools
+                        self._send_progress(
+                            "MCP Unavailable",
+                            "Tool servers failed to start. Retrying without tools...",
+                        )
+                        await self._mcp_toolsets.aclose(idle_timeout=0.0)
+                        self._mcp_toolsets = MCPToolsets()
+                        result = await orchestrator_agent.run(
+                            prompt,
+                            deps=deps,
+                            model=model,
+                        )
+                    else:
+                        raise
+
+                # Dump a structured output (TaskPlan) once, here on the runtime
+                # thread; the dict is both stored on the run and shown in the UI
+                plan = None
+                if isinstance(result.output, BaseModel):
+                    plan = PreparedPlan.from_dict(result.output.model_dump())
+                    agent_run.complete(plan.raw)
                 else:
-                    raise
-
-            # Update agent run record
-            agent_run.complete(
-                result.output.model_dump()
-                if hasattr(result.output, "model_dump")
-                else str(result.output)
-            )
-            usage = result.usage()
-            if usage:
-                agent_run.token_usage = {
-                    "request_tokens": usage.request_tokens,
-                    "response_tokens": usage.response_tokens,
-                    "total_tokens": usage.total_tokens,
-                }
-            self.db_session.commit()
-
-            return result
-
-        except Exception as e:
-            agent_run.fail(str(e))
-            self.db_session.commit()
-            raise
+                    agent_run.complete(str(result.output))
+                usage = result.usage()
+                if usage:
+                    agent_run.token_usage = {
+                        "request_tokens": usage.request_tokens,
+                        "response_tokens": usage.response_tokens,
+                        "total_tokens": usage.total_tokens,
+                    }
+                session.commit()
+
+                return result, plan
+
+            except BaseException as e:
+                # Record failures and cancellations (which are not Exceptions)
+                # instead of leaving the run "running"
+                agent_run.fail("Cancelled by user" if _is_cancellation(e) else str(e))
+                session.commit()
+                raise
+
+            finally:
+                # Release shared servers; they stay up briefly for the next prompt
+                await self._mcp_toolsets.aclose()
 
     async def _request_approval(self, action: str, details: dict) -> bool:
         """Request human approval via UI signal.
@@ -306,20 +486,21 @@ class AgentCoordinator(QObject):
         Returns:
             True if approved, False if denied.
         """
-        # Create approval record
-        # Note: This requires access to the current agent run
-        self._approval_event = asyncio.Event()
-        self._approval_result = False
+        async with self._prompt_lock:
+            # Create approval record
+            # Note: This requires access to the current agent run
+            self._approval_event = asyncio.Event()
+            self._approval_result = False
 
-        # Emit signal to UI (will be received on main thread)
-        self.approval_requested.emit(action, details)
-        self.status_changed.emit("waiting", "Approval")
+            # Emit signal to UI (will be received on main thread)
+            self.approval_requested.emit(action, details)
+            self.status_changed.emit("waiting", "Approval")
 
-        # Wait for response
-        await self._approval_event.wait()
+            # Wait for response
+            await self._approval_event.wait()
 
-        self.status_changed.emit("running", "Orchestrator")
-        return self._approval_result
+            self.status_changed.emit("running", "Orchestrator")
+            return self._approval_result
 
     def _send_progress(self, status: str, details: str) -> None:
         """Send progress update to UI.
@@ -328,19 +509,74 @@ class AgentCoordinator(QObject):
             status: Status label.
             details: Progress details.
         """
-        self.message_received.emit("Assistant", f"**{status}**: {details}")
-        self.history_entry.emit("Orchestrator", f"{status}: {details}", "running")
-
-        # Track step progress during plan execution
-        if status == "Delegating" and self._executing_plan:
-            steps = self._executing_plan.get("steps", [])
+        # Buffer updates and wake the Qt thread once; everything that arrives
+        # before it gets to the flush is shown in a single batch
+        with self._progress_lock:
+            self._progress_buffer.append((status, details))
+            first = len(self._progress_buffer) == 1
+        if first:
+            self._progress_ready.emit()
+
+        # Track step progress during plan execution, unless the steps are
+        # reported by plan index (parallel runs delegate out of order)
+        if (status == "Delegating" and self._executing_plan
+                and not self._steps_reported_by_index):
+            step_count = self._executing_plan.step_count
             # Mark previous step as completed
-            if 0 <= self._current_step_index < len(steps):
-                self.step_status_changed.emit(self._current_step_index, "completed")
+            if 0 <= self._current_step_index < step_count:
+                self._queue_step_update(self._current_step_index, "completed")
             # Advance to next step and mark it running
             self._current_step_index += 1
-            if self._current_step_index < len(steps):
-                self.step_status_changed.emit(self._current_step_index, "running")
+            if self._current_step_index < step_count:
+                self._queue_step_update(self._current_step_index, "running")
+
+    def _report_step_status(self, index: int, status: str) -> None:
+        """Update the status of a plan step by its plan index.
+
+        Args:
+            index: Index of the step in the executing plan.
+            status: New step status.
+        """
+        self._steps_reported_by_index = True
+        plan = self._executing_plan
+        if plan is not None and 0 <= index < plan.step_count:
+            self._queue_step_update(index, status)
+
+    @Slot()
+    def _flush_progress(self) -> None:
+        """Show all buffered progress updates as one chat message."""
+        with self._progress_lock:
+            batch, self._progress_buffer = self._progress_buffer, []
+        if not batch:
+            return
+        self.message_received.emit(
+            "Assistant",
+            "<br>".join(f"**{status}**: {details}" for status, details in batch),
+        )
+        self.history_batch.emit(
+            [("Orchestrator", f"{status}: {details}", "running") for status, details in batch]
+        )
+
+    def _queue_step_update(self, step_index: int, status: str) -> None:
+        """Record a plan step status change to be sent with the next batch.
+
+        Args:
+            step_index: Zero-based index of the step.
+            status: New status (pending, running, completed, failed).
+        """
+        with self._progress_lock:
+            first = not self._pending_step_updates
+            self._pending_step_updates[step_index] = status
+        if first:
+            self._step_updates_ready.emit()
+
+    @Slot()
+    def _flush_step_updates(self) -> None:
+        """Send all queued step status changes as one update."""
+        with self._progress_lock:
+            updates, self._pending_step_updates = self._pending_step_updates, {}
+        if updates:
+            self.steps_status_changed.emit(updates)
 
     async def _ask_question(self, question: str, options: list[str]) -> str:
         """Ask the researcher a multiple-choice question via the UI.
@@ -352,18 +588,19 @@ class AgentCoordinator(QObject):
         Returns:
             The researcher's answer string.
         """
-        self._question_event = asyncio.Event()
-        self._question_answer = ""
+        async with self._prompt_lock:
+            self._question_event = asyncio.Event()
+            self._question_answer = ""
 
-        # Emit signal to UI (received on main thread)
-        self.question_asked.emit(question, options)
-        self.status_changed.emit("waiting", "Your response")
+            # Emit signal to UI (received on main thread)
+            self.question_asked.emit(question, options)
+            self.status_changed.emit("waiting", "Your response")
 
-        # Wait for response
-        await self._question_event.wait()
+            # Wait for response
+            await self._question_event.wait()
 
-        self.status_changed.emit("running", "Orchestrator")
-        return self._question_answer
+            self.status_changed.emit("running", "Orchestrator")
+            return self._question_answer
 
     @Slot(str)
     def handle_question_response(self, answer: str) -> None:
@@ -373,10 +610,8 @@ class AgentCoordinator(QObject):
             answer: The selected or typed answer.
         """
         self._question_answer = answer
-        if self._question_event and self._current_worker and self._current_worker.loop:
-            self._current_worker.loop.call_soon_threadsafe(
-                self._question_event.set
-            )
+        if self._question_event:
+            self._runtime.loop.call_soon_threadsafe(self._question_event.set)
 
     @Slot(bool, str)
     def handle_approval_response(self, approved: bool, notes: str = "") -> None:
@@ -404,10 +639,7 @@ class AgentCoordinator(QObject):
 
         # Otherwise it's an in-agent approval — wake up the waiting coroutine
         if self._approval_event:
-            if self._current_worker and self._current_worker.loop:
-                self._current_worker.loop.call_soon_threadsafe(
-                    self._approval_event.set
-                )
+            self._runtime.loop.call_soon_threadsafe(self._approval_event.set)
 
     def handle_revision_request(self) -> None:
         """Move the pending plan into revision state.
@@ -427,35 +659,54 @@ class AgentCoordinator(QObject):
         self.status_changed.emit("completed", "")
 
     @staticmethod
-    def _build_revision_prompt(plan_data: dict, feedback: str) -> str:
+    def _build_revision_prompt(plan: PreparedPlan, feedback: str) -> str:
         """Build an orchestrator prompt requesting a revised TaskPlan.
 
         Args:
-            plan_data: The original plan dict.
+            plan: The original plan.
             feedback: The researcher's revision feedback.
 
         Returns:
             A prompt string for the orchestrator.
         """
-        steps_text = "\n".join(
-            f"  {i}. [{s.get('agent')}] {s.get('description')}"
-            for i, s in enumerate(plan_data.get("steps", []), 1)
-        )
         return (
             f"The researcher wants to revise the following plan.\n\n"
-            f"Original plan goal: {plan_data.get('goal', '')}\n"
-            f"Original steps:\n{steps_text}\n\n"
+            f"Original plan goal: {plan.goal}\n"
+            f"Original steps:\n{plan.steps_text}\n\n"
             f"Researcher feedback: {feedback}\n\n"
             f"Please produce a revised TaskPlan that addresses the feedback. "
             f"Return only the revised plan as a structured TaskPlan, not free text."
         )
 
     @Slot(object)
-    def _on_agent_finished(self, result: Any) -> None:
+    def _on_run_done(self, future: concurrent.futures.Future) -> None:
+        """Dispatch the outcome of a finished run on the Qt thread.
+
+        Args:
+            future: The future returned when the run was submitted.
+        """
+        self._current_future = None
+        self._current_task = None
+        if future.cancelled():
+            self._on_agent_cancelled()
+        elif (exc := future.exception()) is not None:
+            if _is_cancellation(exc) or self._cancelling:
+                # Exception raised during cancellation (e.g. MCP stdio
+                # teardown raising BrokenResourceError) — treat as cancel.
+                self._on_agent_cancelled()
+            else:
+                logger.error("Agent run failed", exc_info=exc)
+                self._on_agent_error(_format_error(exc))
+        else:
+            self._on_agent_finished(*future.result())
+
+    @Slot(object, object)
+    def _on_agent_finished(self, result: Any, plan: PreparedPlan | None = None) -> None:
         """Handle agent completion.
 
         Args:
             result: The agent's result.
+            plan: The prepared plan, if the agent returned one.
         """
         if not hasattr(result, "output"):
             self.status_changed.emit("completed", "")
@@ -464,29 +715,29 @@ class AgentCoordinator(QObject):
             return
 
         output = result.output
-        if hasattr(output, "model_dump"):
-            # It's a Pydantic model (TaskPlan) — show it and ask to execute
-            plan_data = output.model_dump()
-            self._pending_plan = plan_data
+        if plan is not None:
+            # It's a TaskPlan — show it and ask to execute
+            plan_data = plan.raw
+            self._pending_plan = plan
             self.plan_updated.emit(plan_data)
-            self.message_received.emit(
-                "Assistant", _format_plan_message(plan_data)
-            )
+            self.message_received.emit("Assistant", plan.formatted_html)
             self.history_entry.emit("Orchestrator", "Plan created", "completed")
 
             # Ask user whether to execute the plan
             self.approval_requested.emit(
                 "Execute this plan?",
-                {"goal": plan_data.get("goal", ""),
+                {"goal": plan.goal,
                  "steps": plan_data.get("steps", []),
                  "estimated_agents": plan_data.get("estimated_agents", [])},
             )
         else:
             # Plain string result (execution summary) — just display it
-            # Mark all plan steps as completed
+            # Mark all plan steps as completed, unless each step has
+            # already reported its own outcome
             if self._executing_plan:
-                for i in range(len(self._executing_plan.get("steps", []))):
-                    self.step_status_changed.emit(i, "completed")
+                if not self._steps_reported_by_index:
+                    for i in range(self._executing_plan.step_count):
+                        self._queue_step_update(i, "completed")
                 self._executing_plan = None
                 self._current_step_index = -1
             self.status_changed.emit("completed", "")
@@ -503,8 +754,8 @@ class AgentCoordinator(QObject):
         """
         # Mark current step as failed during plan execution
         if self._executing_plan:
-            if 0 <= self._current_step_index < len(self._executing_plan.get("steps", [])):
-                self.step_status_changed.emit(self._current_step_index, "failed")
+            if 0 <= self._current_step_index < self._executing_plan.step_count:
+                self._queue_step_update(self._current_step_index, "failed")
             self._executing_plan = None
             self._current_step_index = -1
         friendly = _format_user_error(error)
@@ -513,61 +764,55 @@ class AgentCoordinator(QObject):
         self.message_received.emit("System", f"Error: {friendly}")
         self.history_entry.emit("Orchestrator", f"Error: {friendly}", "failed")
 
-    def _execute_plan(self, plan_data: dict, notes: str = "") -> None:
+    def _execute_plan(self, plan: PreparedPlan, notes: str = "") -> None:
         """Run the orchestrator again to execute an approved plan.
 
         Args:
-            plan_data: The approved TaskPlan dict.
+            plan: The approved plan.
             notes: Optional notes from the researcher.
         """
-        steps_text = "\n".join(
-            f"  {i}. [{s.get('agent')}] {s.get('description')}"
-            for i, s in enumerate(plan_data.get("steps", []), 1)
-        )
         execution_prompt = (
             f"The researcher approved the following plan. Execute it now by "
             f"delegating each step to the appropriate agent using your tools. "
-            f"Do NOT return another plan — use delegate_to_project_manager, "
-            f"delegate_to_document_maker, and delegate_to_email_drafter to "
-            f"actually perform each step. Report results as a text summary.\n\n"
-            f"Goal: {plan_data.get('goal', '')}\n"
-            f"Steps:\n{steps_text}"
+            f"Do NOT return another plan — call delegate_plan_steps with the "
+            f"plan's steps in this order to run them, or use "
+            f"delegate_to_project_manager, delegate_to_document_maker, and "
+            f"delegate_to_email_drafter for steps that need an earlier step's "
+            f"output. Report results as a text summary.\n\n"
+            f"Goal: {plan.goal}\n"
+            f"Steps:\n{plan.steps_text}"
         )
         if notes:
             execution_prompt += f"\n\nResearcher notes: {notes}"
 
-        self._executing_plan = plan_data
+        self._executing_plan = plan
         self._current_step_index = -1
+        self._steps_reported_by_index = False
         self.run_async(execution_prompt)
 
     def stop(self) -> None:
         """Stop the current agent execution gracefully."""
-        if self._current_worker and self._current_worker.isRunning():
+        if self._current_task is not None:
+            loop = self._runtime.loop
             # Unblock any pending events so cancellation can propagate
-            if self._approval_event and self._current_worker.loop:
-                self._current_worker.loop.call_soon_threadsafe(
-                    self._approval_event.set
-                )
-            if self._question_event and self._current_worker.loop:
-                self._current_worker.loop.call_soon_threadsafe(
-                    self._question_event.set
-                )
-
-            self._current_worker.cancel()
-            self._current_worker.wait(5000)  # 5s timeout for graceful cancel
+            if self._approval_event:
+                loop.call_soon_threadsafe(self._approval_event.set)
+            if self._question_event:
+                loop.call_soon_threadsafe(self._question_event.set)
 
-            # Hard kill if graceful cancel didn't work
-            if self._current_worker and self._current_worker.isRunning():
-                self._current_worker.terminate()
-                self._current_worker.wait()
-
-            self._current_worker = None
+            # Cancel cooperatively; the run reports back through _on_run_done
+            # once its cleanup has finished
+            self._cancelling = True
+            loop.call_soon_threadsafe(self._current_task.cancel)
+        elif self._current_future is not None:
+            # Submitted but not started yet
+            self._cancelling = True
+            self._current_future.cancel()
 
         # Reset plan state
         if self._executing_plan:
-            steps = self._executing_plan.get("steps", [])
-            if 0 <= self._current_step_index < len(steps):
-                self.step_status_changed.emit(self._current_step_index, "failed")
+            if 0 <= self._current_step_index < self._executing_plan.step_count:
+                self._queue_step_update(self._current_step_index, "failed")
             self._executing_plan = None
             self._current_step_index = -1
         self._pending_plan = None
@@ -578,13 +823,34 @@ class AgentCoordinator(QObject):
         self.status_changed.emit("cancelled", "")
         self.task_changed.emit("")
 
+    def preload(self) -> None:
+        """Prepare for the first prompt in the background.
+
+        Imports the agent stack on the runtime thread and, when npx is
+        available, warms the npm cache for the MCP server packages.
+        """
+
+        async def _preload() -> None:
+            import src.agents  # noqa: F401
+            from src.mcp.warmup import warm_npx_cache
+
+            if self._config.npx_available:
+                await warm_npx_cache()
+
+        self._runtime.submit(_preload())
+
+    def shutdown(self) -> None:
+        """Cancel any running agent and stop the shared async runtime."""
+        if self._current_future is not None:
+            self.stop()
+        self._runtime.shutdown()
+
     @Slot()
     def _on_agent_cancelled(self) -> None:
         """Handle agent cancellation."""
         if self._executing_plan:
-            steps = self._executing_plan.get("steps", [])
-            if 0 <= self._current_step_index < len(steps):
-                self.step_status_changed.emit(self._current_step_index, "failed")
+            if 0 <= self._current_step_index < self._executing_plan.step_count:
+                self._queue_step_update(self._current_step_index, "failed")
             self._executing_plan = None
             self._current_step_index = -1
         self._pending_plan = None
@@ -1,10 +1,24 @@
 """Export service for generating CSV and document exports."""
 
 import csv
+import os
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 from typing import Any
 
+# Write buffer for CSV exports; large exports go to disk in few big writes
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Cost categories of a ProjectEstimate and their "type" column labels
+COST_CATEGORIES = (
+    ("material_costs", "Material"),
+    ("labor_costs", "Labor"),
+    ("regulatory_costs", "Regulatory"),
+    ("other_costs", "Other"),
+)
+
 
 class ExportService:
     """Service for exporting data to various formats."""
@@ -21,14 +35,16 @@ class ExportService:
 
     def export_to_csv(
         self,
-        data: list[dict],
+        data: Iterable[dict],
         filename: str,
         fieldnames: list[str] | None = None,
     ) -> Path:
         """Export data to a CSV file.
 
+        Rows are written as they are produced, so *data* may be a generator.
+
         Args:
-            data: List of dictionaries to export.
+            data: Dictionaries to export.
             filename: Name of the output file (with or without .csv).
             fieldnames: Optional list of field names (column order).
 
@@ -40,19 +56,30 @@ class ExportService:
 
         filepath = self.exports_dir / filename
 
-        if not data:
-            # Create empty file with headers if no data
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            # Create empty file if no data
             filepath.touch()
             return filepath
 
-        # Determine fieldnames from data if not provided
-        if fieldnames is None:
-            fieldnames = list(data[0].keys())
-
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(data)
+        with open(
+            filepath, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE
+        ) as f:
+            if fieldnames is None:
+                # Determine fieldnames from data
+                writer = csv.DictWriter(f, fieldnames=list(first.keys()), extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(chain((first,), rows))
+            else:
+                # Known column order: write plain tuples, skipping DictWriter's
+                # per-row field checks
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(
+                    tuple(row.get(name, "") for name in fieldnames)
+                    for row in chain((first,), rows)
+                )
 
         return filepath
 
@@ -74,31 +101,21 @@ class ExportService:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"cost_estimate_{timestamp}.csv"
 
-        # Flatten all costs into single list
-        all_costs = []
-
-        for cost in estimate.get("material_costs", []):
-            all_costs.append({**cost, "type": "Material"})
-
-        for cost in estimate.get("labor_costs", []):
-            all_costs.append({**cost, "type": "Labor"})
-
-        for cost in estimate.get("regulatory_costs", []):
-            all_costs.append({**cost, "type": "Regulatory"})
-
-        for cost in estimate.get("other_costs", []):
-            all_costs.append({**cost, "type": "Other"})
-
-        # Add summary row
-        all_costs.append({
-            "type": "TOTAL",
-            "category": "",
-            "description": "Total Estimated Cost",
-            "estimated_cost": estimate.get("total_estimated_cost", 0),
-            "currency": "USD",
-            "source": "",
-            "confidence": "",
-        })
+        def rows() -> Iterator[dict]:
+            for key, cost_type in COST_CATEGORIES:
+                for cost in estimate.get(key, []):
+                    yield cost | {"type": cost_type}
+
+            # Summary row
+            yield {
+                "type": "TOTAL",
+                "category": "",
+                "description": "Total Estimated Cost",
+                "estimated_cost": estimate.get("total_estimated_cost", 0),
+                "currency": "USD",
+                "source": "",
+                "confidence": "",
+            }
 
         fieldnames = [
             "type",
@@ -110,7 +127,7 @@ class ExportService:
             "confidence",
         ]
 
-        return self.export_to_csv(all_costs, filename, fieldnames)
+        return self.export_to_csv(rows(), filename, fieldnames)
 
     def export_document_list(
         self,
@@ -210,16 +227,18 @@ class ExportService:
         Returns:
             List of export file info dictionaries.
         """
-        exports = []
-
-        for file_path in self.exports_dir.iterdir():
-            if file_path.is_file():
-                exports.append({
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime),
-                    "type": file_path.suffix.lower(),
-                })
-
-        return sorted(exports, key=lambda x: x["modified"], reverse=True)
+        # DirEntry caches its stat result, so each file is stat'ed once
+        with os.scandir(self.exports_dir) as it:
+            entries = [(entry, entry.stat()) for entry in it if entry.is_file()]
+
+        entries.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        return [
+            {
+                "name": entry.name,
+                "path": entry.path,
+                "size": st.st_size,
+                "modified": datetime.fromtimestamp(st.st_mtime),
+                "type": os.path.splitext(entry.name)[1].lower(),
+            }
+            for entry, st in entries
+        ]
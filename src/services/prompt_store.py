@@ -1,8 +1,10 @@
 """Persistent store for per-agent custom instructions."""
 
-import json
+import os
 from pathlib import Path
 
+import orjson
+
 from src.utils.config import get_config
 
 VALID_AGENT_KEYS = frozenset({
@@ -22,6 +24,9 @@ class PromptStore:
 
     def __init__(self, path: Path | None = None):
         self._path = path or get_config().app_data_dir / "agent_prompts.json"
+        # Parsed file contents and the mtime they were read at
+        self._cache: dict[str, str] | None = None
+        self._cache_mtime: int = -1
 
     # ------------------------------------------------------------------
     # Public API
@@ -33,40 +38,101 @@ class PromptStore:
         return data.get(agent_key, "")
 
     def set(self, agent_key: str, text: str) -> None:
-        """Persist custom instructions for *agent_key*."""
-        data = self._read()
+        """Persist custom instructions for *agent_key*.
+
+        Blank text removes the entry. Nothing is written when the stored
+        value would not change.
+
+        Raises:
+            ValueError: If *agent_key* is not a known agent.
+        """
+        self._check_key(agent_key)
+        current = self._read()
         if text.strip():
+            if current.get(agent_key) == text:
+                return
+            data = dict(current)
             data[agent_key] = text
         else:
-            data.pop(agent_key, None)
+            if agent_key not in current:
+                return
+            data = dict(current)
+            del data[agent_key]
         self._write(data)
 
     def clear(self, agent_key: str) -> None:
-        """Remove custom instructions for *agent_key*."""
-        data = self._read()
-        if agent_key in data:
+        """Remove custom instructions for *agent_key*.
+
+        Raises:
+            ValueError: If *agent_key* is not a known agent.
+        """
+        self._check_key(agent_key)
+        current = self._read()
+        if agent_key in current:
+            data = dict(current)
             del data[agent_key]
             self._write(data)
 
     def get_all(self) -> dict[str, str]:
         """Return all stored custom instructions."""
-        return self._read()
+        return dict(self._read())
+
+    @property
+    def version(self) -> int:
+        """Modification stamp of the backing file (``0`` if it does not exist).
+
+        Changes whenever the stored instructions are rewritten, so callers can
+        use it to invalidate anything derived from the store's contents.
+        """
+        try:
+            return self._path.stat().st_mtime_ns
+        except OSError:
+            return 0
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _check_key(agent_key: str) -> None:
+        if agent_key not in VALID_AGENT_KEYS:
+            raise ValueError(f"Unknown agent key: {agent_key!r}")
+
     def _read(self) -> dict[str, str]:
-        if self._path.exists():
+        """Return the stored data, re-parsing the file only when it changed.
+
+        The returned dict is shared with the cache and must not be mutated.
+        """
+        try:
+            mtime = self._path.stat().st_mtime_ns
+        except OSError:
+            return {}
+        if mtime != self._cache_mtime:
             try:
-                return json.loads(self._path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
+                self._cache = orjson.loads(self._path.read_bytes())
+            except (orjson.JSONDecodeError, OSError):
                 return {}
-        return {}
+            self._cache_mtime = mtime
+        return self._cache
 
     def _write(self, data: dict[str, str]) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        # Write a sibling file and rename it over the old one, so a crash
+        # mid-write can't leave a truncated store behind
+        tmp = self._path.with_suffix(".json.tmp")
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, self._path)
+        self._cache = data
+        self._cache_mtime = self._path.stat().st_mtime_ns
+
+
+# Shared store instance
+_store: PromptStore | None = None
+
+
+def get_prompt_store() -> PromptStore:
+    """Return the shared prompt store for the configured app data directory."""
+    global _store
+    if _store is None:
+        _store = PromptStore()
+    return _store
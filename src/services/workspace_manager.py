@@ -1,9 +1,70 @@
 """Workspace manager for file and directory operations."""
 
+import os
+import re
 import shutil
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+# Characters replaced when turning a project name into a directory name;
+# \w keeps letters and digits in any script, like str.isalnum()
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w.\- ]")
+
+# Seconds get_workspace trusts an earlier lookup of an existing workspace
+WORKSPACE_CACHE_TTL = 2.0
+# Seconds get_workspace remembers that a path does not exist
+WORKSPACE_MISS_TTL = 1.0
+
+# Threads list_documents uses to list top-level subdirectories concurrently
+SCAN_WORKERS = 4
+
+# Characters encoded per write in write_document, bounding the extra memory
+# needed to save a large document
+WRITE_CHUNK_SIZE = 1 << 20
+
+
+def _scandir(path: str) -> list[os.DirEntry]:
+    """Return the entries of *path*, or none if it can't be listed."""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _scan_tree(path: str) -> Iterator[os.DirEntry]:
+    """Yield every entry below *path*, recursing into subdirectories.
+
+    Symlinked directories are not followed, and missing or unreadable
+    directories are skipped, as with ``Path.rglob``. ``DirEntry`` caches its
+    file type and stat result, so callers can inspect entries without extra
+    syscalls.
+    """
+    for entry in _scandir(path):
+        yield entry
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_tree(entry.path)
+
+
+def _document_infos(entries: Iterable[os.DirEntry], prefix_len: int) -> list[dict]:
+    """Build list_documents entries for the files among *entries*."""
+    documents = []
+    for entry in entries:
+        if entry.is_file():
+            st = entry.stat()
+            documents.append({
+                "name": entry.name,
+                "path": entry.path,
+                "relative_path": entry.path[prefix_len:],
+                "size": st.st_size,
+                "modified": datetime.fromtimestamp(st.st_mtime),
+                "type": os.path.splitext(entry.name)[1].lower(),
+            })
+    return documents
+
 
 class WorkspaceManager:
     """Manages project workspace directories and files."""
@@ -18,6 +79,15 @@ class WorkspaceManager:
             base_path = Path.home() / ".clinical_research_assistant" / "workspaces"
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # Workspace paths known to exist, with the monotonic time they expire
+        self._dir_cache: dict[str, float] = {}
+        # Paths found missing, with the monotonic time they expire
+        self._neg_cache: dict[str, float] = {}
+
+    def clear_cache(self) -> None:
+        """Forget cached workspace lookups."""
+        self._dir_cache.clear()
+        self._neg_cache.clear()
 
     def create_workspace(self, project_name: str) -> Path:
         """Create a new workspace directory for a project.
@@ -29,11 +99,10 @@ class WorkspaceManager:
             Path to the created workspace.
         """
         # Sanitize project name for filesystem
-        safe_name = "".join(c if c.isalnum() or c in "._- " else "_" for c in project_name)
-        safe_name = safe_name.strip().replace(" ", "_")
+        safe_name = _UNSAFE_NAME_CHARS.sub("_", project_name).strip().replace(" ", "_")
 
         # Add timestamp to ensure uniqueness
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         workspace_name = f"{safe_name}_{timestamp}"
 
         workspace_path = self.base_path / workspace_name
@@ -44,6 +113,7 @@ class WorkspaceManager:
         (workspace_path / "drafts").mkdir(exist_ok=True)
         (workspace_path / "exports").mkdir(exist_ok=True)
 
+        self.clear_cache()
         return workspace_path
 
     def get_workspace(self, workspace_path: str | Path) -> Path | None:
@@ -53,11 +123,23 @@ class WorkspaceManager:
             workspace_path: Path to the workspace.
 
         Returns:
-            Path if exists, None otherwise.
+            Path if exists, None otherwise. Lookups are cached for
+            ``WORKSPACE_CACHE_TTL`` seconds (``WORKSPACE_MISS_TTL`` for
+            missing paths).
         """
         path = Path(workspace_path)
-        if path.exists() and path.is_dir():
+        key = str(path)
+        now = time.monotonic()
+        if self._dir_cache.get(key, 0.0) > now:
             return path
+        if self._neg_cache.get(key, 0.0) > now:
+            return None
+        if path.is_dir():
+            self._dir_cache[key] = now + WORKSPACE_CACHE_TTL
+            self._neg_cache.pop(key, None)
+            return path
+        self._dir_cache.pop(key, None)
+        self._neg_cache[key] = now + WORKSPACE_MISS_TTL
         return None
 
     def list_workspaces(self) -> list[Path]:
@@ -82,6 +164,7 @@ class WorkspaceManager:
         """
         path = Path(workspace_path)
         if path.exists() and path.is_dir():
+            self.clear_cache()
             shutil.rmtree(path)
             return True
         return False
@@ -95,21 +178,29 @@ class WorkspaceManager:
         Returns:
             List of document info dictionaries.
         """
-        path = Path(workspace_path)
+        root = str(Path(workspace_path))
+        prefix_len = len(root) + 1
+        top = _scandir(root)
+        subdirs = [entry for entry in top if entry.is_dir(follow_symlinks=False)]
+        if len(subdirs) < 2:
+            return _document_infos(_scan_tree(root), prefix_len)
+
+        # Directory reads release the GIL, so subtrees are listed concurrently;
+        # results are merged in the same order as a sequential walk
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(subdirs))) as pool:
+            subtrees = dict(zip(
+                (entry.path for entry in subdirs),
+                pool.map(
+                    lambda entry: _document_infos(_scan_tree(entry.path), prefix_len),
+                    subdirs,
+                ),
+            ))
         documents = []
-
-        for doc_path in path.rglob("*"):
-            if doc_path.is_file():
-                rel_path = doc_path.relative_to(path)
-                documents.append({
-                    "name": doc_path.name,
-                    "path": str(doc_path),
-                    "relative_path": str(rel_path),
-                    "size": doc_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(doc_path.stat().st_mtime),
-                    "type": doc_path.suffix.lower(),
-                })
-
+        for entry in top:
+            if entry.path in subtrees:
+                documents.extend(subtrees[entry.path])
+            else:
+                documents.extend(_document_infos((entry,), prefix_len))
         return documents
 
     def read_document(self, file_path: str | Path) -> str | None:
@@ -153,7 +244,12 @@ class WorkspaceManager:
             path.mkdir(parents=True, exist_ok=True)
 
         file_path = path / filename
-        file_path.write_text(content, encoding="utf-8")
+        with open(file_path, "w", encoding="utf-8", buffering=WRITE_CHUNK_SIZE) as f:
+            for start in range(0, len(content), WRITE_CHUNK_SIZE):
+                f.write(content[start:start + WRITE_CHUNK_SIZE])
+        # Creating subdirectories may have created a previously missing path
+        if subdirectory:
+            self._neg_cache.clear()
         return file_path
 
     def copy_file(
@@ -181,6 +277,8 @@ class WorkspaceManager:
 
         dest_path = dest_dir / source_path.name
         shutil.copy2(source_path, dest_path)
+        if subdirectory:
+            self._neg_cache.clear()
         return dest_path
 
     def get_workspace_stats(self, workspace_path: str | Path) -> dict:
@@ -197,10 +295,13 @@ class WorkspaceManager:
         if not path.exists():
             return {"error": "Workspace not found"}
 
-        files = list(path.rglob("*"))
-        file_count = sum(1 for f in files if f.is_file())
-        dir_count = sum(1 for f in files if f.is_dir())
-        total_size = sum(f.stat().st_size for f in files if f.is_file())
+        file_count = dir_count = total_size = 0
+        for entry in _scan_tree(str(path)):
+            if entry.is_dir():
+                dir_count += 1
+            elif entry.is_file():
+                file_count += 1
+                total_size += entry.stat().st_size
 
         return {
             "path": str(path),
@@ -1,6 +1,7 @@
 """Agent status and history panel."""
 
-from datetime import datetime
+import time
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,6 +16,40 @@ from PySide6.QtCore import Slot, Qt, QEasingCurve, QSequentialAnimationGroup, QP
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QGraphicsOpacityEffect
 
+# Status indicator colors for set_status
+_STATUS_COLORS = {
+    "idle": "#9E9E9E",
+    "running": "#2196F3",
+    "completed": "#4CAF50",
+    "error": "#f44336",
+    "waiting": "#FF9800",
+}
+
+# History entry icons per status
+_STATUS_ICONS = {
+    "completed": "✓",
+    "failed": "✗",
+    "running": "→",
+    "pending": "○",
+}
+
+_GREEN = QColor("#4CAF50")
+
+# History keeps the newest _HISTORY_MAX entries; older ones are trimmed in
+# one batch once the list reaches _HISTORY_TRIM
+_HISTORY_MAX = 50
+_HISTORY_TRIM = 64
+
+# History entry colors by action text, first match wins:
+# (match function, lowercase text, color)
+_ACTION_COLORS = (
+    (str.startswith, "delegating", QColor("#1976D2")),  # Material blue
+    (str.startswith, "question", QColor("#F57F17")),  # Amber
+    (str.__contains__, "document saved", _GREEN),
+    (str.__contains__, "draft saved", _GREEN),
+    (str.__contains__, "export complete", _GREEN),
+    (str.startswith, "approval required", QColor("#FF9800")),  # Orange
+)
 
 class AgentStatusPanel(QWidget):
     """Panel showing agent execution status and history."""
@@ -115,15 +150,7 @@ class AgentStatusPanel(QWidget):
             status: Status message (idle, running, completed, error).
             agent: Name of the active agent.
         """
-        status_colors = {
-            "idle": "#9E9E9E",
-            "running": "#2196F3",
-            "completed": "#4CAF50",
-            "error": "#f44336",
-            "waiting": "#FF9800",
-        }
-
-        color = status_colors.get(status.lower(), "#9E9E9E")
+        color = _STATUS_COLORS.get(status.lower(), "#9E9E9E")
         self.status_indicator.setText(f"● {status.title()}")
         self.status_indicator.setStyleSheet(f"color: {color}; font-weight: bold;")
 
@@ -158,42 +185,48 @@ class AgentStatusPanel(QWidget):
             action: Description of the action.
             status: Status of the action (completed, failed).
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
 
-        status_icons = {
-            "completed": "✓",
-            "failed": "✗",
-            "running": "→",
-            "pending": "○",
-        }
-        icon = status_icons.get(status, "•")
+        icon = _STATUS_ICONS.get(status, "•")
 
         item = QListWidgetItem(f"{timestamp} {icon} [{agent}] {action}")
 
         # Color based on status and action type
-        action_lower = action.lower()
         if status == "failed":
             item.setForeground(Qt.red)
-        elif action_lower.startswith("delegating"):
-            item.setForeground(QColor("#1976D2"))  # Material blue
-        elif action_lower.startswith("question"):
-            item.setForeground(QColor("#F57F17"))  # Amber
-        elif (
-            "document saved" in action_lower
-            or "draft saved" in action_lower
-            or "export complete" in action_lower
-        ):
-            item.setForeground(QColor("#4CAF50"))  # Green
-        elif action_lower.startswith("approval required"):
-            item.setForeground(QColor("#FF9800"))  # Orange
-        elif status == "completed":
-            item.setForeground(QColor("#4CAF50"))  # Green
+        else:
+            action_lower = action.lower()
+            for match, text, color in _ACTION_COLORS:
+                if match(action_lower, text):
+                    item.setForeground(color)
+                    break
+            else:
+                if status == "completed":
+                    item.setForeground(_GREEN)
 
         self.history_list.insertItem(0, item)
 
         # Keep history limited
-        while self.history_list.count() > 50:
-            self.history_list.takeItem(self.history_list.count() - 1)
+        count = self.history_list.count()
+        if count >= _HISTORY_TRIM:
+            updates_enabled = self.history_list.updatesEnabled()
+            self.history_list.setUpdatesEnabled(False)
+            self.history_list.model().removeRows(_HISTORY_MAX, count - _HISTORY_MAX)
+            self.history_list.setUpdatesEnabled(updates_enabled)
+
+    @Slot(list)
+    def add_history_entries(self, entries: list) -> None:
+        """Add several entries to the history list with a single repaint.
+
+        Args:
+            entries: (agent, action, status) tuples, oldest first.
+        """
+        self.history_list.setUpdatesEnabled(False)
+        try:
+            for agent, action, status in entries:
+                self.add_history_entry(agent, action, status)
+        finally:
+            self.history_list.setUpdatesEnabled(True)
 
     def highlight_agent(self, agent_name: str) -> None:
         """Highlight an agent in the agents list.
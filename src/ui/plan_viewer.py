@@ -148,10 +148,25 @@ class PlanViewer(QWidget):
             step_index: Zero-based index of the step.
             status: New status (pending, running, completed, failed).
         """
-        if self._current_plan and "steps" in self._current_plan:
-            if 0 <= step_index < len(self._current_plan["steps"]):
-                self._current_plan["steps"][step_index]["status"] = status
-                self.update_plan(self._current_plan)
+        self.update_step_statuses({step_index: status})
+
+    @Slot(object)
+    def update_step_statuses(self, updates: dict) -> None:
+        """Update the status of several steps with a single redraw.
+
+        Args:
+            updates: Mapping of zero-based step index to new status.
+        """
+        if not (self._current_plan and "steps" in self._current_plan):
+            return
+        steps = self._current_plan["steps"]
+        changed = False
+        for step_index, status in updates.items():
+            if 0 <= step_index < len(steps):
+                steps[step_index]["status"] = status
+                changed = True
+        if changed:
+            self.update_plan(self._current_plan)
 
     def clear(self) -> None:
         """Clear the plan display."""
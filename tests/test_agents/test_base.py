@@ -0,0 +1,54 @@
+"""Tests for the shared agent dependencies."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from src.agents.base import AgentDeps
+from src.models import Base, Project
+
+
+@pytest.fixture
+def deps(tmp_path):
+    """Create agent dependencies on a temporary SQLite database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine, expire_on_commit=False) as session:
+        yield AgentDeps(
+            db_session=session,
+            workspace_path=str(tmp_path),
+            project_id=1,
+            mcp_filesystem=None,
+            mcp_web_search=None,
+            mcp_email=None,
+            approval_callback=AsyncMock(return_value=True),
+            progress_callback=MagicMock(),
+            question_callback=AsyncMock(return_value=""),
+        )
+    engine.dispose()
+
+
+class TestReadOnly:
+    """Tests for AgentDeps.read_only."""
+
+    def test_reads_committed_rows(self, deps):
+        """Test that the connection sees rows committed through the session."""
+        deps.db_session.add(Project(name="Trial", workspace_path="/tmp/trial"))
+        deps.db_session.commit()
+
+        with deps.read_only() as conn:
+            names = conn.execute(select(Project.name)).scalars().all()
+
+        assert names == ["Trial"]
+
+    def test_bypasses_the_session(self, deps):
+        """Test that reads neither autoflush nor load objects into the session."""
+        deps.db_session.add(Project(name="Pending", workspace_path="/tmp/pending"))
+
+        with deps.read_only() as conn:
+            count = len(conn.execute(select(Project.id)).all())
+            assert conn.engine is deps.db_session.get_bind()
+
+        assert count == 0
+        assert len(deps.db_session.new) == 1
@@ -1,10 +1,18 @@
 """Tests for the orchestrator agent."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from pydantic_ai import RunContext
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.usage import RunUsage
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 
+from src.agents import orchestrator
 from src.agents.base import AgentDeps
-from src.agents.orchestrator import orchestrator_agent, TaskPlan, PlanStep
+from src.agents.orchestrator import orchestrator_agent, run_plan_parallel, TaskPlan, PlanStep
 
 
 @pytest.fixture
@@ -78,5 +86,167 @@ class TestOrchestratorAgent:
         assert "update_researcher" in tool_names
 
 
+@pytest.fixture
+def run_ctx(tmp_path):
+    """Create a run context with real dependencies on an in-memory database."""
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        deps = AgentDeps(
+            db_session=session,
+            workspace_path=str(tmp_path),
+            project_id=1,
+            mcp_filesystem=None,
+            mcp_web_search=None,
+            mcp_email=None,
+            approval_callback=AsyncMock(return_value=True),
+            progress_callback=MagicMock(),
+            question_callback=AsyncMock(return_value=""),
+            step_status_callback=MagicMock(),
+        )
+        yield RunContext(deps=deps, model=TestModel(), usage=RunUsage())
+    engine.dispose()
+
+
+class TestRunPlanParallel:
+    """Tests for concurrent plan execution."""
+
+    @staticmethod
+    def _plan(*steps: tuple[str, bool]) -> TaskPlan:
+        return TaskPlan(
+            goal="Test goal",
+            steps=[
+                PlanStep(description=f"step {i}", agent=agent, requires_approval=approval)
+                for i, (agent, approval) in enumerate(steps)
+            ],
+            estimated_agents=[],
+        )
+
+    async def test_independent_steps_run_concurrently(self, run_ctx, monkeypatch):
+        """Test that independent steps overlap but respect max_inflight."""
+        active = 0
+        peak = 0
+        sessions = set()
+
+        async def fake_step(ctx, step):
+            nonlocal active, peak
+            sessions.add(ctx.deps.db_session)
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return f"done {step.description}"
+
+        monkeypatch.setitem(orchestrator._STEP_DISPATCH, "project_manager", fake_step)
+        plan = self._plan(*[("project_manager", False)] * 5)
+
+        results = await run_plan_parallel(run_ctx, plan, max_inflight=2)
+
+        assert results == [f"done step {i}" for i in range(5)]
+        assert peak == 2
+        # Every step gets its own database session
+        assert len(sessions) == 5
+        assert run_ctx.deps.db_session not in sessions
+
+    async def test_approval_steps_keep_their_place(self, run_ctx, monkeypatch):
+        """Test that an approval step runs after the steps before it only."""
+        order = []
+
+        async def fake_step(ctx, step):
+            await asyncio.sleep(0.01 if step.description == "step 0" else 0)
+            order.append(step.description)
+            return "ok"
+
+        async def approve(description, inputs):
+            order.append(f"approve {description}")
+            return True
+
+        monkeypatch.setitem(orchestrator._STEP_DISPATCH, "project_manager", fake_step)
+        run_ctx.deps.approval_callback = approve
+        plan = self._plan(
+            ("project_manager", False),
+            ("project_manager", True),
+            ("project_manager", False),
+        )
+
+        await run_plan_parallel(run_ctx, plan)
+
+        assert order == ["step 0", "approve step 1", "step 1", "step 2"]
+
+    async def test_failures_and_denied_approvals(self, run_ctx, monkeypatch):
+        """Test that a failing step or denied approval does not abort the plan."""
+        async def failing_step(ctx, step):
+            raise RuntimeError("boom")
+
+        async def ok_step(ctx, step):
+            return "ok"
+
+        monkeypatch.setitem(orchestrator._STEP_DISPATCH, "document_maker", failing_step)
+        monkeypatch.setitem(orchestrator._STEP_DISPATCH, "email_drafter", ok_step)
+        run_ctx.deps.approval_callback = AsyncMock(return_value=False)
+        plan = self._plan(("document_maker", False), ("email_drafter", True), ("unknown", False))
+
+        results = await run_plan_parallel(run_ctx, plan)
+
+        assert results[0] == "Failed: boom"
+        assert results[1] == "Skipped: not approved by researcher"
+        assert results[2].startswith("Skipped: unknown agent")
+        run_ctx.deps.approval_callback.assert_awaited_once()
+
+    async def test_reports_status_by_plan_index(self, run_ctx, monkeypatch):
+        """Test that each step's status is reported against its own index."""
+        async def ok_step(ctx, step):
+            return "ok"
+
+        async def failing_step(ctx, step):
+            raise RuntimeError("boom")
+
+        monkeypatch.setitem(orchestrator._STEP_DISPATCH, "project_manager", ok_step)
+        monkeypatch.setitem(orchestrator._STEP_DISPATCH, "document_maker", failing_step)
+        plan = self._plan(("project_manager", False), ("document_maker", False))
+
+        await run_plan_parallel(run_ctx, plan)
+
+        calls = [c.args for c in run_ctx.deps.step_status_callback.call_args_list]
+        assert sorted(calls) == [
+            (0, "completed"), (0, "running"), (1, "failed"), (1, "running"),
+        ]
+
+    async def test_overlapping_prompts_are_serialized(self, run_ctx, monkeypatch):
+        """Test that concurrent steps prompting the researcher are asked in turn."""
+        from src.services import agent_coordinator
+
+        loop = asyncio.get_running_loop()
+        monkeypatch.setattr(agent_coordinator, "get_session_factory", MagicMock())
+        monkeypatch.setattr(agent_coordinator, "get_async_runtime", lambda: MagicMock(loop=loop))
+        coordinator = agent_coordinator.AgentCoordinator(MagicMock(), MagicMock())
+        prompts = []
+        coordinator.approval_requested.connect(lambda action, details: prompts.append(action))
+        coordinator.question_asked.connect(lambda question, options: prompts.append(question))
+
+        async def approving_step(ctx, step):
+            return await ctx.deps.approval_callback(step.description, {})
+
+        async def asking_step(ctx, step):
+            return await ctx.deps.question_callback(step.description, ["a", "b"])
+
+        monkeypatch.setitem(orchestrator._STEP_DISPATCH, "project_manager", approving_step)
+        monkeypatch.setitem(orchestrator._STEP_DISPATCH, "document_maker", asking_step)
+        run_ctx.deps.approval_callback = coordinator._request_approval
+        run_ctx.deps.question_callback = coordinator._ask_question
+        plan = self._plan(("project_manager", False), ("document_maker", False))
+
+        run = asyncio.create_task(run_plan_parallel(run_ctx, plan))
+        await asyncio.sleep(0.01)
+        assert prompts == ["step 0"]
+
+        coordinator.handle_approval_response(True)
+        await asyncio.sleep(0.01)
+        assert prompts == ["step 0", "step 1"]
+
+        coordinator.handle_question_response("b")
+        assert await asyncio.wait_for(run, 1) == [True, "b"]
+
+
+
 # Integration tests would go here, requiring actual API calls
 # These should be marked with @pytest.mark.integration
@@ -0,0 +1,15 @@
+"""Minimal stdio MCP server used by the MCP tests."""
+
+from mcp.server.fastmcp import FastMCP
+
+server = FastMCP("fake")
+
+
+@server.tool()
+def ping() -> str:
+    """Reply with pong."""
+    return "pong"
+
+
+if __name__ == "__main__":
+    server.run()
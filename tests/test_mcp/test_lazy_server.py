@@ -0,0 +1,97 @@
+"""Tests for the lazily started MCP server toolset."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.mcp import MCPServerStdio
+from pydantic_ai.models.test import TestModel
+
+from src.mcp import config
+from src.mcp.config import LazyMCPServer, MCPSchemaCache
+
+
+FAKE_SERVER = str(Path(__file__).with_name("fake_server.py"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_schema_cache(tmp_path, monkeypatch):
+    """Keep tool definitions out of the shared in-memory and on-disk caches."""
+    monkeypatch.setattr(config, "_tool_definitions", {})
+    monkeypatch.setattr(config, "schema_cache", MCPSchemaCache(tmp_path / "mcp_schemas.json"))
+
+
+@pytest.fixture
+def host_starts(monkeypatch):
+    """Record every host task started for a server."""
+    starts = []
+    real_host_server = config._host_server
+
+    async def counting_host_server(*args):
+        starts.append(args[0])
+        await real_host_server(*args)
+
+    monkeypatch.setattr(config, "_host_server", counting_host_server)
+    return starts
+
+
+def make_server(**kwargs) -> LazyMCPServer:
+    """Create a lazy server wrapping the fake stdio server."""
+    return LazyMCPServer(
+        MCPServerStdio(sys.executable, args=[FAKE_SERVER], timeout=10),
+        name="fake",
+        **kwargs,
+    )
+
+
+class TestLazyMCPServer:
+    """Tests for LazyMCPServer."""
+
+    async def test_runs_share_one_host(self, host_starts):
+        """Test that agent runs reuse one subprocess and aclose stops it."""
+        server = make_server()
+        agent = Agent(TestModel())
+
+        for _ in range(2):
+            result = await agent.run("ping", toolsets=[server])
+            assert "pong" in result.output
+
+        assert len(host_starts) == 1
+        assert server.running
+
+        await server.aclose()
+
+        assert not server.running
+        assert not server.wrapped.is_running
+
+    async def test_startup_failure_reported_once(self):
+        """Test that a server that can't start contributes no tools."""
+        failures = []
+        server = LazyMCPServer(
+            MCPServerStdio("/nonexistent/server", args=[], timeout=10),
+            name="broken",
+            on_failure=lambda name, exc: failures.append(name),
+        )
+
+        assert await server.get_tools(None) == {}
+        assert await server.get_tools(None) == {}
+        assert server.failed
+        assert failures == ["broken"]
+
+    async def test_cancelled_startup_can_be_retried(self):
+        """Test that cancelling a pending startup doesn't leave a dead host."""
+        server = make_server()
+        server.prewarm()
+        await asyncio.sleep(0)
+        server.process.prewarm.cancel()
+        await asyncio.gather(server.process.prewarm, return_exceptions=True)
+
+        assert not server.running
+        assert not server.failed
+
+        tools = await server.get_tools(None)
+        assert list(tools) == ["ping"]
+
+        await server.aclose()
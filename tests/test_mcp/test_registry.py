@@ -0,0 +1,119 @@
+"""Tests for the shared MCP process registry."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic_ai.mcp import MCPServerStdio
+
+from src.mcp import config
+from src.mcp.config import LazyMCPServer, MCPSchemaCache
+from src.mcp.registry import MCPProcessRegistry
+
+
+FAKE_SERVER = str(Path(__file__).with_name("fake_server.py"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_schema_cache(tmp_path, monkeypatch):
+    """Keep tool definitions out of the shared in-memory and on-disk caches."""
+    monkeypatch.setattr(config, "_tool_definitions", {})
+    monkeypatch.setattr(config, "schema_cache", MCPSchemaCache(tmp_path / "mcp_schemas.json"))
+
+
+@pytest.fixture
+def registry():
+    """Create an empty registry."""
+    return MCPProcessRegistry()
+
+
+def fake_server() -> LazyMCPServer:
+    """Create a lazy server wrapping the fake stdio server."""
+    return LazyMCPServer(
+        MCPServerStdio(sys.executable, args=[FAKE_SERVER], timeout=10),
+        name="fake",
+    )
+
+
+def broken_server() -> LazyMCPServer:
+    """Create a lazy server whose command does not exist."""
+    return LazyMCPServer(
+        MCPServerStdio("/nonexistent/server", args=[], timeout=10),
+        name="broken",
+    )
+
+
+class TestMCPProcessRegistry:
+    """Tests for MCPProcessRegistry."""
+
+    async def test_holders_share_one_process(self, registry):
+        """Test that holders of the same server share its subprocess."""
+        first = registry.acquire("fake", "/ws", fake_server)
+        second = registry.acquire("fake", "/ws", fake_server)
+        other = registry.acquire("fake", "/other", fake_server)
+
+        assert first.process is second.process
+        assert first.process is not other.process
+
+        await first.get_tools(None)
+        assert second.running
+
+        for server in (first, second, other):
+            await registry.release(server, idle_timeout=0)
+        assert not first.running
+
+    async def test_failure_callback_per_holder(self, registry):
+        """Test that each holder is notified through its own callback."""
+        failures = []
+        first = registry.acquire(
+            "broken", "/ws", broken_server, lambda name, exc: failures.append("first")
+        )
+        second = registry.acquire(
+            "broken", "/ws", broken_server, lambda name, exc: failures.append("second")
+        )
+
+        await first.get_tools(None)
+        await second.get_tools(None)
+
+        assert failures == ["first", "second"]
+
+    async def test_failed_server_is_replaced(self, registry):
+        """Test that a failed server is not handed out again."""
+        server = registry.acquire("broken", "/ws", broken_server)
+        await server.get_tools(None)
+        assert server.failed
+
+        replacement = registry.acquire("broken", "/ws", broken_server)
+
+        assert replacement.process is not server.process
+        assert not replacement.failed
+
+    async def test_idle_server_expires(self, registry):
+        """Test that an unused server is stopped after its idle timeout."""
+        server = registry.acquire("fake", "/ws", fake_server)
+        await server.get_tools(None)
+
+        await registry.release(server, idle_timeout=0.05)
+        assert server.running
+
+        await asyncio.sleep(0.1)
+        await asyncio.gather(*registry._closing)
+
+        assert not server.running
+        assert not registry._closing
+
+    async def test_reacquire_cancels_expiry(self, registry):
+        """Test that acquiring an idle server keeps it running."""
+        server = registry.acquire("fake", "/ws", fake_server)
+        await server.get_tools(None)
+        await registry.release(server, idle_timeout=0.05)
+
+        again = registry.acquire("fake", "/ws", fake_server)
+        await asyncio.sleep(0.1)
+
+        assert again.process is server.process
+        assert again.running
+
+        await registry.release(again, idle_timeout=0)
+        assert not again.running
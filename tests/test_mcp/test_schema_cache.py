@@ -0,0 +1,77 @@
+"""Tests for the on-disk MCP tool schema cache."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic_ai.mcp import MCPServerStdio
+from pydantic_ai.tools import ToolDefinition
+
+from src.mcp import config
+from src.mcp.config import LazyMCPServer, MCPSchemaCache
+
+
+FAKE_SERVER = str(Path(__file__).with_name("fake_server.py"))
+
+
+@pytest.fixture(autouse=True)
+def empty_definitions(monkeypatch):
+    """Start every test with no tool definitions in memory."""
+    monkeypatch.setattr(config, "_tool_definitions", {})
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Path of the cache file."""
+    return tmp_path / "mcp_schemas.json"
+
+
+class TestMCPSchemaCache:
+    """Tests for MCPSchemaCache."""
+
+    async def test_store_and_load(self, cache_path):
+        """Test that stored definitions are loaded as stale."""
+        key = ("npx", "-y", "server")
+        tool_defs = {"ping": ToolDefinition(name="ping", description="Ping")}
+        await MCPSchemaCache(cache_path).store(key, tool_defs)
+
+        config._tool_definitions.clear()
+        cache = MCPSchemaCache(cache_path)
+        cache.load()
+
+        assert config._tool_definitions[key] == tool_defs
+        assert cache.claim_stale(key)
+        assert not cache.claim_stale(key)
+
+    def test_corrupt_file_is_ignored(self, cache_path):
+        """Test that an unreadable cache file loads nothing."""
+        cache_path.write_text("{not json")
+
+        MCPSchemaCache(cache_path).load()
+
+        assert config._tool_definitions == {}
+
+    async def test_stale_definitions_revalidated_on_use(self, cache_path, monkeypatch):
+        """Test serving cached tools without starting, then refreshing them."""
+        server = LazyMCPServer(
+            MCPServerStdio(sys.executable, args=[FAKE_SERVER], timeout=10),
+            name="fake",
+        )
+        stale = {"ping": ToolDefinition(name="ping", description="old")}
+        await MCPSchemaCache(cache_path).store(server.cache_key, stale)
+        config._tool_definitions.clear()
+        cache = MCPSchemaCache(cache_path)
+        cache.load()
+        monkeypatch.setattr(config, "schema_cache", cache)
+
+        tools = await server.get_tools(None)
+        assert list(tools) == ["ping"]
+        assert not server.running
+
+        assert await server.call_tool("ping", {}, None, tools["ping"]) == "pong"
+        await server.process.revalidate
+
+        assert config._tool_definitions[server.cache_key]["ping"].description != "old"
+        assert not cache.claim_stale(server.cache_key)
+
+        await server.aclose()
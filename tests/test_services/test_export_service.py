@@ -64,6 +64,16 @@ class TestExportService:
 
         assert header == "a,b,c"
 
+    def test_export_to_csv_from_generator(self, export_service):
+        """Test CSV export streamed from a generator."""
+        rows = ({"name": f"Item {i}", "value": i} for i in range(3))
+
+        filepath = export_service.export_to_csv(rows, "streamed")
+
+        with open(filepath, "r", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            assert [row["value"] for row in reader] == ["0", "1", "2"]
+
     def test_export_empty_csv(self, export_service):
         """Test exporting empty data."""
         filepath = export_service.export_to_csv([], "empty")
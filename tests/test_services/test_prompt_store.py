@@ -0,0 +1,64 @@
+"""Tests for the prompt store."""
+
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+
+from src.services.prompt_store import PromptStore
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for the store file."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def prompt_store(temp_dir):
+    """Create a prompt store backed by a temporary file."""
+    return PromptStore(temp_dir / "agent_prompts.json")
+
+
+class TestPromptStore:
+    """Tests for PromptStore."""
+
+    def test_set_and_get(self, prompt_store):
+        """Test storing and reading instructions."""
+        prompt_store.set("orchestrator", "Be brief.")
+
+        assert prompt_store.get("orchestrator") == "Be brief."
+        assert prompt_store.get("email_drafter") == ""
+
+    def test_set_blank_removes(self, prompt_store):
+        """Test that blank text removes the entry."""
+        prompt_store.set("orchestrator", "Be brief.")
+        prompt_store.set("orchestrator", "   ")
+
+        assert prompt_store.get_all() == {}
+
+    def test_unchanged_set_does_not_write(self, prompt_store):
+        """Test that saving the same text leaves the file untouched."""
+        prompt_store.set("orchestrator", "Be brief.")
+        version = prompt_store.version
+
+        prompt_store.set("orchestrator", "Be brief.")
+        prompt_store.clear("email_drafter")
+
+        assert prompt_store.version == version
+
+    def test_invalid_key(self, prompt_store):
+        """Test that unknown agent keys are rejected."""
+        with pytest.raises(ValueError):
+            prompt_store.set("nonexistent", "text")
+        with pytest.raises(ValueError):
+            prompt_store.clear("nonexistent")
+
+    def test_sees_external_changes(self, prompt_store, temp_dir):
+        """Test that writes from another store instance are picked up."""
+        prompt_store.get_all()
+        PromptStore(temp_dir / "agent_prompts.json").set("document_maker", "Cite sources.")
+
+        assert prompt_store.get("document_maker") == "Cite sources."
@@ -5,7 +5,7 @@ from pathlib import Path
 import tempfile
 import shutil
 
-from src.services.workspace_manager import WorkspaceManager
+from src.services.workspace_manager import WorkspaceManager, _document_infos, _scan_tree
 
 
 @pytest.fixture
@@ -66,6 +66,27 @@ class TestWorkspaceManager:
         assert result is True
         assert not workspace_path.exists()
 
+    def test_get_workspace(self, workspace_manager):
+        """Test looking up a workspace before and after deleting it."""
+        workspace_path = workspace_manager.create_workspace("Lookup")
+
+        assert workspace_manager.get_workspace(workspace_path) == workspace_path
+        assert workspace_manager.get_workspace(workspace_path) == workspace_path
+
+        workspace_manager.delete_workspace(workspace_path)
+
+        assert workspace_manager.get_workspace(workspace_path) is None
+
+    def test_get_workspace_after_miss(self, workspace_manager, temp_base_path):
+        """Test that a cached miss is dropped once the path is created."""
+        missing = temp_base_path / "later"
+
+        assert workspace_manager.get_workspace(missing) is None
+
+        workspace_manager.write_document(temp_base_path, "a.txt", "x", subdirectory="later")
+
+        assert workspace_manager.get_workspace(missing) == missing
+
     def test_delete_nonexistent_workspace(self, workspace_manager):
         """Test deleting a workspace that doesn't exist."""
         result = workspace_manager.delete_workspace("/nonexistent/path")
@@ -120,6 +141,22 @@ class TestWorkspaceManager:
         assert "doc1.txt" in doc_names
         assert "doc2.md" in doc_names
 
+    def test_list_documents_matches_sequential_walk(self, workspace_manager):
+        """Test that the concurrent listing returns what a single walk does."""
+        workspace_path = workspace_manager.create_workspace("Walk Test")
+        for subdirectory, name in (
+            ("", "top.txt"), ("a", "one.txt"), ("a/deep", "two.md"),
+            ("b", "three.csv"), ("c/d", "four.txt"),
+        ):
+            workspace_manager.write_document(workspace_path, name, name, subdirectory)
+
+        documents = workspace_manager.list_documents(workspace_path)
+
+        root = str(workspace_path)
+        expected = _document_infos(_scan_tree(root), len(root) + 1)
+        assert documents == expected
+        assert len({d["relative_path"] for d in documents}) >= 5
+
     def test_get_workspace_stats(self, workspace_manager):
         """Test getting workspace statistics."""
         workspace_path = workspace_manager.create_workspace("Stats Test")